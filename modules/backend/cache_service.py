@@ -0,0 +1,75 @@
+"""
+Cache Service
+In-process TTL cache with an optional shared Redis tier for multi-worker deployments.
+"""
+
+import os
+import json
+import asyncio
+import logging
+from typing import Any, Optional
+from cachetools import TTLCache
+
+logger = logging.getLogger(__name__)
+
+
+class CacheService:
+    """Two-tier cache: bounded in-memory TTL cache, optionally backed by Redis."""
+    
+    def __init__(self, namespace: str, maxsize: int = 4096, ttl: int = 86400):
+        """
+        Args:
+            namespace: Key prefix used in Redis
+            maxsize: Maximum number of in-memory entries
+            ttl: Entry lifetime in seconds
+        """
+        self.namespace = namespace
+        self.ttl = ttl
+        self._memory = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = asyncio.Lock()
+        self._redis = None
+        
+        if os.getenv("USE_REDIS", "False").lower() == "true":
+            import redis.asyncio as aioredis
+            self._redis = aioredis.Redis(
+                host=os.getenv("REDIS_HOST", "localhost"),
+                port=int(os.getenv("REDIS_PORT", "6379"))
+            )
+    
+    async def get(self, key: str) -> Optional[Any]:
+        """Get a cached value, or None on miss."""
+        async with self._lock:
+            value = self._memory.get(key)
+        if value is not None or self._redis is None:
+            return value
+        
+        try:
+            raw = await self._redis.get(f"{self.namespace}:{key}")
+        except Exception as e:
+            logger.warning(f"Redis get failed ({self.namespace}): {e}")
+            return None
+        if raw is None:
+            return None
+        
+        value = json.loads(raw)
+        async with self._lock:
+            self._memory[key] = value
+        return value
+    
+    async def set(self, key: str, value: Any):
+        """Store a JSON-serializable value."""
+        async with self._lock:
+            self._memory[key] = value
+        if self._redis is None:
+            return
+        
+        try:
+            await self._redis.set(f"{self.namespace}:{key}", json.dumps(value), ex=self.ttl)
+        except Exception as e:
+            logger.warning(f"Redis set failed ({self.namespace}): {e}")
+    
+    async def close(self):
+        """Close the Redis connection, if any."""
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
@@ -3,11 +3,11 @@ Export Service
 Handles data export in various formats (CSV, JSON, GeoJSON, PDF).
 """
 
-import json
 import csv
 import io
 import logging
-from typing import Dict, Any, List
+import orjson
+from typing import Dict, Any, List, Iterator
 from datetime import datetime
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -15,8 +15,17 @@ from reportlab.lib.units import inch
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
 from reportlab.lib import colors
 
+from model_service import forecast_rows
+
 logger = logging.getLogger(__name__)
 
+# Target size of each chunk written to a streamed export
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+# Indented like the previous json.dumps(indent=2) output; NumPy values from
+# model results serialize directly
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+
 
 class ExportService:
     """Service for exporting data in various formats."""
@@ -35,7 +44,30 @@ class ExportService:
         Returns:
             CSV string
         """
-        output = io.StringIO()
+        return b''.join(self.export_csv_iter(data, export_type)).decode('utf-8')
+    
+    def export_csv_iter(self, data: Dict[str, Any], export_type: str) -> Iterator[bytes]:
+        """
+        Export data as CSV, yielding chunks as rows are written.
+        
+        Args:
+            data: Data to export
+            export_type: Type of export (prediction, forecast, history)
+            
+        Yields:
+            UTF-8 CSV chunks of roughly _STREAM_CHUNK_SIZE bytes
+        """
+        # Rows are encoded straight into a byte buffer, so chunks need no
+        # separate str -> bytes pass before hitting the socket
+        buffer = io.BytesIO()
+        output = io.TextIOWrapper(buffer, encoding='utf-8', newline='')
+        
+        def flush():
+            output.flush()
+            chunk = buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            return chunk
         
         if export_type == "prediction":
             writer = csv.writer(output)
@@ -83,7 +115,7 @@ class ExportService:
                 'Net_Change_mm', 'Cumulative_Storage_mm', 'Confidence'
             ])
             
-            for item in data.get('forecast', []):
+            for item in forecast_rows(data.get('forecast', [])):
                 writer.writerow([
                     item.get('month', ''),
                     item.get('precipitation_mm', ''),
@@ -93,6 +125,8 @@ class ExportService:
                     item.get('cumulative_storage_mm', ''),
                     item.get('confidence', '')
                 ])
+                if buffer.tell() >= _STREAM_CHUNK_SIZE:
+                    yield flush()
         
         elif export_type == "history":
             writer = csv.writer(output)
@@ -111,8 +145,10 @@ class ExportService:
                     item.get('probability', ''),
                     item.get('data_source', '')
                 ])
+                if buffer.tell() >= _STREAM_CHUNK_SIZE:
+                    yield flush()
         
-        return output.getvalue()
+        yield flush()
     
     def export_json(self, data: Dict[str, Any], include_metadata: bool = True) -> str:
         """
@@ -125,6 +161,19 @@ class ExportService:
         Returns:
             JSON string
         """
+        return self.export_json_bytes(data, include_metadata).decode('utf-8')
+    
+    def export_json_bytes(self, data: Dict[str, Any], include_metadata: bool = True) -> bytes:
+        """
+        Export data as UTF-8 encoded JSON.
+        
+        Args:
+            data: Data to export
+            include_metadata: Include metadata
+            
+        Returns:
+            JSON bytes
+        """
         if include_metadata:
             export_data = {
                 "metadata": {
@@ -137,7 +186,7 @@ class ExportService:
         else:
             export_data = data
         
-        return json.dumps(export_data, indent=2)
+        return orjson.dumps(export_data, option=_JSON_OPTIONS)
     
     def export_geojson(self, data: Dict[str, Any]) -> str:
         """
@@ -149,6 +198,18 @@ class ExportService:
         Returns:
             GeoJSON string
         """
+        return self.export_geojson_bytes(data).decode('utf-8')
+    
+    def export_geojson_bytes(self, data: Dict[str, Any]) -> bytes:
+        """
+        Export data as UTF-8 encoded GeoJSON.
+        
+        Args:
+            data: Data to export
+            
+        Returns:
+            GeoJSON bytes
+        """
         features = []
         
         # Handle single prediction
@@ -197,7 +258,7 @@ class ExportService:
             "features": features
         }
         
-        return json.dumps(geojson, indent=2)
+        return orjson.dumps(geojson, option=_JSON_OPTIONS)
     
     def export_pdf(self, data: Dict[str, Any], export_type: str) -> bytes:
         """
@@ -363,7 +424,7 @@ class ExportService:
         
         forecast_data = [['Month', 'Precip (mm)', 'Recharge (mm)', 'Net Change (mm)']]
         
-        for item in data.get('forecast', [])[:12]:
+        for item in forecast_rows(data.get('forecast', []))[:12]:
             forecast_data.append([
                 item.get('month', ''),
                 f"{item.get('precipitation_mm', 0):.1f}",
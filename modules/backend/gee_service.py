@@ -6,27 +6,416 @@ Handles all GEE data fetching and processing.
 import ee
 import os
 import logging
+import httpx
 import numpy as np
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Set, Tuple, Any
 from datetime import datetime, timedelta
 import asyncio
+import functools
+import math
+import random
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from types import MappingProxyType
+
+from cache_service import CacheService
 
 logger = logging.getLogger(__name__)
 
+# Fallback values for get_features, keyed by the source band names
+_FEATURE_DEFAULTS = {
+    'elevation': 1500,
+    'slope': 5.0,
+    'precipitation': 800,
+    'mean_2m_air_temperature': 293,
+    'NDVI': 0.5,
+    'Map': 50,
+    'upa': 1.0
+}
+
+# MERIT Hydro pixel size (m), used to turn upstream area into specific catchment area
+_MERIT_SCALE = 90
+
+# Tile layer configurations (read-only; shared across requests). Palettes are
+# pre-joined into the comma-separated form getMapId accepts.
+_DATASET_CONFIGS = MappingProxyType({
+    'chirps': MappingProxyType({
+        'collection': 'UCSB-CHG/CHIRPS/DAILY',
+        'band': 'precipitation',
+        'vis_params': MappingProxyType({
+            'min': 1,
+            'max': 17,
+            'palette': '001137,0aab1e,e7eb05,ff4a2d,e90000'
+        }),
+        'temporal': True
+    }),
+    'era5': MappingProxyType({
+        'collection': 'ECMWF/ERA5/MONTHLY',
+        'band': 'mean_2m_air_temperature',
+        'vis_params': MappingProxyType({
+            'min': 250,
+            'max': 320,
+            'palette': '000080,0000ff,00ffff,ffff00,ff0000,800000'
+        }),
+        'temporal': True
+    }),
+    'srtm': MappingProxyType({
+        'collection': 'USGS/SRTMGL1_003',
+        'band': 'elevation',
+        'vis_params': MappingProxyType({
+            'min': 0,
+            'max': 3000,
+            'palette': '006633,E5FFCC,662A00,D8D8D8,F5F5F5'
+        }),
+        'temporal': False
+    }),
+    'sentinel2': MappingProxyType({
+        'collection': 'COPERNICUS/S2_SR',
+        'band': 'NDVI',
+        'vis_params': MappingProxyType({
+            'min': -1,
+            'max': 1,
+            'palette': 'brown,yellow,green,darkgreen'
+        }),
+        'temporal': True,
+        'compute_ndvi': True
+    }),
+    'worldcover': MappingProxyType({
+        'collection': 'ESA/WorldCover/v100',
+        'band': 'Map',
+        'vis_params': MappingProxyType({
+            'min': 10,
+            'max': 100,
+            'palette': '006400,ffbb22,ffff4c,f096ff,fa0000,b4b4b4,f0f0f0,0064c8,0096a0,00cf75,fae6a0'
+        }),
+        'temporal': False
+    })
+})
+
+# Tile URL templates stay valid for a while; static layers much longer
+_TILE_TTL_TEMPORAL = 1800
+_TILE_TTL_STATIC = 86400
+
+# Earth Engine endpoint for parallel, non-interactive traffic
+_EE_HIGHVOLUME_URL = 'https://earthengine-highvolume.googleapis.com'
+
+# Backoff schedule (seconds) for throttled or unavailable Earth Engine calls;
+# up to a second of jitter is added so concurrent retries spread out
+_EE_RETRY_DELAYS = (1, 2, 4, 8)
+_EE_RETRYABLE = ('429', '503', 'quota', 'too many', 'unavailable')
+
+# ESA WorldCover class names, indexed directly by class value
+_LC_NAMES = np.full(101, 'Unknown', dtype=object)
+for _value, _name in {
+    10: 'Tree cover',
+    20: 'Shrubland',
+    30: 'Grassland',
+    40: 'Cropland',
+    50: 'Built-up',
+    60: 'Bare / sparse vegetation',
+    70: 'Snow and ice',
+    80: 'Permanent water bodies',
+    90: 'Herbaceous wetland',
+    95: 'Mangroves',
+    100: 'Moss and lichen'
+}.items():
+    _LC_NAMES[_value] = _name
+del _value, _name
+
+# Class names used in regional class distributions, keyed by histogram bucket
+_LC_REGIONAL_NAMES = MappingProxyType({
+    '10': 'Tree cover', '20': 'Shrubland', '30': 'Grassland',
+    '40': 'Cropland', '50': 'Built-up', '60': 'Bare/sparse vegetation',
+    '70': 'Snow and ice', '80': 'Water bodies', '90': 'Herbaceous wetland',
+    '95': 'Mangroves', '100': 'Moss and lichen'
+})
+
+# NDVI class boundaries; a value falls in the class after the last bound it reaches
+_NDVI_BINS = np.array([0.0, 0.2, 0.4, 0.6])
+_NDVI_LABELS = np.array([
+    'Water or snow',
+    'Bare soil or rock',
+    'Sparse vegetation',
+    'Moderate vegetation',
+    'Dense vegetation'
+], dtype=object)
+
+# tileScale for regional reductions. Larger values split the computation into
+# smaller tiles: more parallel workers and lower per-worker memory (avoids
+# "User memory limit exceeded"), at some scheduling overhead. Fine-scale
+# reductions (<= 100 m) get the smaller tiles; coarse climate grids don't need them.
+_TILE_SCALE_FINE = 8
+_TILE_SCALE_COARSE = 4
+
+# Daily point series longer than this are sampled in concurrent windows
+_SERIES_WINDOW_DAYS = 90
+
+# Slippy-map zoom that regional queries are snapped to (~310 km tiles at the equator)
+_REGION_TILE_ZOOM = 7
+
+# Feature properties stored on each cell of the precomputed grid asset
+_GRID_FEATURE_KEYS = ['elevation', 'slope', 'precip_mean', 'temp_mean', 'ndvi', 'landcover', 'upa']
+
+
+def topographic_wetness_index(slope_deg, catchment_area):
+    """
+    TWI = ln(a / tan(slope)); accepts scalars or NumPy arrays.
+    
+    Args:
+        slope_deg: Slope in degrees
+        catchment_area: Upslope contributing area
+        
+    Returns:
+        TWI value(s)
+    """
+    # Floor tan(slope) to avoid division by zero on flat terrain
+    tan_slope = np.clip(np.tan(np.deg2rad(slope_deg)), 1e-3, None)
+    return np.log(catchment_area / tan_slope)
+
+
+def summarize_series(values: List[float], offset: float = 0.0) -> Dict[str, float]:
+    """
+    Min/max/mean/std of a sampled series in one contiguous float32 array.
+    
+    Args:
+        values: Sampled values (None entries are ignored)
+        offset: Added once to the whole array before reducing (e.g. -273.15)
+        
+    Returns:
+        Dictionary with min, max, mean and std
+    """
+    arr = np.asarray(values, dtype=np.float32)
+    if offset:
+        arr += offset
+    return {
+        'min': float(np.nanmin(arr)),
+        'max': float(np.nanmax(arr)),
+        'mean': float(np.nanmean(arr)),
+        'std': float(np.nanstd(arr))
+    }
+
+
+def landcover_name(class_value):
+    """
+    WorldCover class name(s); accepts a scalar or a NumPy array of classes.
+    
+    Args:
+        class_value: Class value(s)
+        
+    Returns:
+        Class name, or an object array of names for array input
+    """
+    classes = np.asarray(class_value, dtype=np.int64)
+    valid = (classes >= 0) & (classes < len(_LC_NAMES))
+    names = np.where(valid, _LC_NAMES[np.where(valid, classes, 0)], 'Unknown')
+    return names if names.ndim else str(names[()])
+
+
+def tile_scale_for(scale: float) -> int:
+    """tileScale to use for a regional reduction at the given scale (m)."""
+    return _TILE_SCALE_FINE if scale <= 100 else _TILE_SCALE_COARSE
+
+
+def compute_ndvi(image):
+    """
+    Sentinel-2 NDVI as a single-band image that keeps the acquisition time.
+    
+    Written as a plain band-math expression; the epsilon keeps the float
+    division defined on zero-reflectance pixels.
+    """
+    ndvi = image.expression(
+        '(nir - red) / (nir + red + 1e-6)',
+        {'nir': image.select('B8'), 'red': image.select('B4')}
+    ).rename('NDVI')
+    return ee.Image(ndvi.copyProperties(image, ['system:time_start']))
+
+
+@dataclass(frozen=True, slots=True)
+class LocationFeatures:
+    """Model input features for a single location."""
+    elevation: float
+    slope: float
+    precip_mean: float
+    temp_mean: float
+    ndvi: float
+    landcover: int
+    twi: float
+    
+    def get(self, name: str, default: Any = None) -> Any:
+        """Dict-style lookup, so feature consumers accept either form."""
+        return getattr(self, name, default)
+    
+    def __getitem__(self, name: str) -> Any:
+        try:
+            return getattr(self, name)
+        except AttributeError:
+            raise KeyError(name) from None
+    
+    def to_dict(self) -> Dict[str, float]:
+        """Plain dictionary for JSON responses."""
+        return asdict(self)
+
+
+def region_tiles(bbox: List[float], zoom: int = _REGION_TILE_ZOOM) -> List[Tuple[int, int]]:
+    """
+    Slippy-map tiles covering a bounding box.
+    
+    Args:
+        bbox: [west, south, east, north]
+        zoom: Tile zoom level
+        
+    Returns:
+        List of (x, y) tile indices
+    """
+    n = 2 ** zoom
+    
+    def tile_xy(lon, lat):
+        lat = math.radians(min(max(lat, -85.0511), 85.0511))
+        x = int((lon + 180.0) / 360.0 * n)
+        y = int((1.0 - math.asinh(math.tan(lat)) / math.pi) / 2.0 * n)
+        return min(max(x, 0), n - 1), min(max(y, 0), n - 1)
+    
+    west, south, east, north = bbox
+    x0, y0 = tile_xy(west, north)
+    x1, y1 = tile_xy(east, south)
+    return [(x, y) for x in range(x0, x1 + 1) for y in range(y0, y1 + 1)]
+
+
+def tile_bounds(x: int, y: int, zoom: int = _REGION_TILE_ZOOM) -> List[float]:
+    """[west, south, east, north] of a slippy-map tile."""
+    n = 2 ** zoom
+    
+    def lat(row):
+        return math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * row / n))))
+    
+    return [x / n * 360.0 - 180.0, lat(y + 1), (x + 1) / n * 360.0 - 180.0, lat(y)]
+
+
+def clip_bounds(bounds: List[float], bbox: List[float]) -> Optional[List[float]]:
+    """
+    Intersection of two [west, south, east, north] boxes.
+    
+    Returns:
+        The overlapping box, or None if the boxes only touch or are disjoint
+    """
+    west, south = max(bounds[0], bbox[0]), max(bounds[1], bbox[1])
+    east, north = min(bounds[2], bbox[2]), min(bounds[3], bbox[3])
+    if west >= east or south >= north:
+        return None
+    return [west, south, east, north]
+
+
+def merge_tile_stats(tiles) -> Dict[str, Dict[str, float]]:
+    """
+    Combine per-tile reductions into statistics for their union.
+    
+    Args:
+        tiles: Per-tile reduceRegion results with {band}_mean, _stdDev,
+            _min, _max and _count entries
+            
+    Returns:
+        Per-band {'mean', 'std', 'min', 'max'}: count-weighted mean, pooled
+        std, min of mins and max of maxes
+    """
+    merged = {}
+    for tile in tiles:
+        for name, count in tile.items():
+            if not name.endswith('_count') or not count:
+                continue
+            band = name[:-len('_count')]
+            mean = tile.get(f"{band}_mean")
+            if mean is None:
+                continue
+            std = tile.get(f"{band}_stdDev") or 0.0
+            acc = merged.setdefault(band, {
+                'sum': 0.0, 'sum_sq': 0.0, 'count': 0, 'min': math.inf, 'max': -math.inf
+            })
+            acc['sum'] += mean * count
+            acc['sum_sq'] += (std * std + mean * mean) * count
+            acc['count'] += count
+            acc['min'] = min(acc['min'], tile[f"{band}_min"])
+            acc['max'] = max(acc['max'], tile[f"{band}_max"])
+    
+    stats = {}
+    for band, acc in merged.items():
+        if len(tiles) == 1:
+            # A single tile is already the exact reduction
+            tile = tiles[0]
+            stats[band] = {
+                'mean': tile[f"{band}_mean"],
+                'std': tile.get(f"{band}_stdDev") or 0.0,
+                'min': tile[f"{band}_min"],
+                'max': tile[f"{band}_max"]
+            }
+            continue
+        mean = acc['sum'] / acc['count']
+        variance = max(acc['sum_sq'] / acc['count'] - mean * mean, 0.0)
+        stats[band] = {
+            'mean': mean,
+            'std': math.sqrt(variance),
+            'min': acc['min'],
+            'max': acc['max']
+        }
+    return stats
+
 
 class GEEService:
     """Service for fetching data from Google Earth Engine."""
     
     def __init__(self):
         self.region_bounds = [33.9, -4.7, 41.9, 5.5]  # Kenya bounds
+        # Most recent low-cloud Sentinel-2 scenes to composite for NDVI
+        self.s2_limit = 12
+        self.s2_tile_limit = 24
+        # Optional precomputed feature grid (see build_feature_asset)
+        self.feature_asset = os.getenv('GEE_FEATURE_ASSET')
+        self.grid_scale_m = int(os.getenv('GEE_FEATURE_GRID_SCALE', '1000'))
+        self._grid = None
+        # Tile URL templates, shared across workers through the Redis tier
+        self._tile_url_cache = CacheService('gee_tile_urls', maxsize=1024, ttl=_TILE_TTL_TEMPORAL)
+        self._static_tile_url_cache = CacheService('gee_tile_urls_static', maxsize=64, ttl=_TILE_TTL_STATIC)
+        # Cap concurrent EE calls to stay inside per-user quota
+        max_concurrency = int(os.getenv('GEE_MAX_CONCURRENCY', '8'))
+        self._sem = asyncio.Semaphore(max_concurrency)
+        # Dedicated pool for blocking EE calls so they never stall the event
+        # loop; sized to the semaphore, since every call holds a slot
+        self._pool = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix='gee')
+        # In-flight fetches by key, shared by concurrent identical requests
+        self._inflight: Dict[str, asyncio.Task] = {}
+        # Point results keyed on a ~1 km lat/lon grid
+        self._feature_cache = CacheService('gee_features', maxsize=4096, ttl=86400)
+        self._stats_cache = CacheService('gee_dataset_stats', maxsize=4096, ttl=86400)
+        self._climate_cache = CacheService('gee_climate', maxsize=4096, ttl=86400)
+        # Regional reductions per grid tile, reused across overlapping bboxes
+        self._region_tile_cache = CacheService('gee_region_tiles', maxsize=10000, ttl=3600)
+        # Whole regional results; static layers (SRTM, WorldCover) keep for 30 days
+        self._regional_cache = CacheService('gee_regional', maxsize=1024, ttl=3600)
+        self._static_regional_cache = CacheService('gee_regional_static', maxsize=1024, ttl=30 * 86400)
+        # Expired temporal results are served for a day while being refreshed
+        self._regional_stale_cache = CacheService('gee_regional_stale', maxsize=1024, ttl=86400)
+        self._background_tasks: Set[asyncio.Task] = set()
+        self._area_cache = CacheService('gee_region_area', maxsize=4096, ttl=30 * 86400)
+        # High-volume endpoint: built for many concurrent automated requests
+        # (roughly 100 RPS per project) rather than interactive latency.
+        # Set GEE_ENDPOINT to an empty string to use the library default.
+        self.endpoint = os.getenv('GEE_ENDPOINT', _EE_HIGHVOLUME_URL) or None
+        self.initialized = False
+        self._http: Optional[httpx.AsyncClient] = None
         
     async def initialize(self):
         """Initialize GEE authentication."""
+        # Shared keep-alive client for plain REST fetches (tile URLs, downloads)
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                timeout=30.0,
+                limits=httpx.Limits(max_connections=32, keepalive_expiry=60)
+            )
+        
         try:
             # Try default authentication first (personal account)
             try:
                 project = os.getenv('GEE_PROJECT', 'aquapredict-473718')
-                ee.Initialize(project=project)
+                ee.Initialize(project=project, opt_url=self.endpoint)
                 logger.info(f"GEE initialized with default credentials (project: {project})")
                 self.initialized = True
                 return
@@ -35,7 +424,7 @@ class GEEService:
                 
                 # Try without project
                 try:
-                    ee.Initialize()
+                    ee.Initialize(opt_url=self.endpoint)
                     logger.info("GEE initialized with default credentials (no project)")
                     self.initialized = True
                     return
@@ -48,7 +437,7 @@ class GEEService:
             
             if service_account and os.path.exists(key_file):
                 credentials = ee.ServiceAccountCredentials(service_account, key_file)
-                ee.Initialize(credentials)
+                ee.Initialize(credentials, opt_url=self.endpoint)
                 logger.info("GEE initialized with service account")
                 self.initialized = True
                 return
@@ -65,7 +454,124 @@ class GEEService:
         """Check if GEE is available."""
         return self.initialized
     
-    async def get_features(self, lat: float, lon: float) -> Dict[str, float]:
+    # Source handles, built once on first use (after ee.Initialize) and
+    # shared across requests to keep the computation graphs small
+    
+    @functools.cached_property
+    def _dem(self):
+        return ee.Image('USGS/SRTMGL1_003')
+    
+    @functools.cached_property
+    def _slope(self):
+        return ee.Terrain.slope(self._dem)
+    
+    @functools.cached_property
+    def _chirps(self):
+        return ee.ImageCollection('UCSB-CHG/CHIRPS/DAILY')
+    
+    @functools.cached_property
+    def _era5(self):
+        return ee.ImageCollection('ECMWF/ERA5/MONTHLY').select('mean_2m_air_temperature')
+    
+    @functools.cached_property
+    def _s2(self):
+        return ee.ImageCollection('COPERNICUS/S2_SR')
+    
+    @functools.cached_property
+    def _worldcover(self):
+        return ee.ImageCollection('ESA/WorldCover/v100').first()
+    
+    @functools.cached_property
+    def _upa(self):
+        return ee.Image('MERIT/Hydro/v1_0_1').select('upa')
+    
+    async def close(self):
+        """Release the shared HTTP client."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+        self._pool.shutdown(wait=False)
+        await self._feature_cache.close()
+        await self._stats_cache.close()
+        await self._climate_cache.close()
+        await self._region_tile_cache.close()
+        await self._tile_url_cache.close()
+        await self._static_tile_url_cache.close()
+        await self._regional_cache.close()
+        await self._static_regional_cache.close()
+        await self._regional_stale_cache.close()
+        await self._area_cache.close()
+    
+    async def _ee_call(self, fn, *args):
+        """
+        Run a blocking Earth Engine call in a worker thread.
+        
+        Concurrency is bounded by GEE_MAX_CONCURRENCY, and quota/rate-limit
+        or transient unavailability errors are retried with jittered
+        exponential backoff (outside the semaphore, so waiting calls don't
+        hold a slot).
+        """
+        for delay in _EE_RETRY_DELAYS + (None,):
+            try:
+                async with self._sem:
+                    return await asyncio.get_running_loop().run_in_executor(
+                        self._pool, functools.partial(fn, *args)
+                    )
+            except ee.EEException as e:
+                message = str(e).lower()
+                retryable = any(marker in message for marker in _EE_RETRYABLE)
+                if delay is None or not retryable:
+                    raise
+                logger.warning(f"EE call throttled, retrying in ~{delay}s: {e}")
+                await asyncio.sleep(delay + random.random())
+    
+    async def _single_flight(self, key: str, fetch):
+        """
+        Run fetch() once per key, sharing its result with concurrent callers.
+        
+        Callers arriving while a fetch for the same key is in flight await
+        that fetch instead of starting another. A caller that is cancelled
+        does not cancel the shared fetch.
+        
+        Args:
+            key: Identity of the fetch (typically its cache key)
+            fetch: Zero-argument callable returning the coroutine to run
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+    
+    def _run_in_background(self, coro):
+        """Run a coroutine as a fire-and-forget task, logging any failure."""
+        task = asyncio.ensure_future(coro)
+        # Keep a reference so the task isn't garbage collected mid-flight
+        self._background_tasks.add(task)
+        
+        def done(t):
+            self._background_tasks.discard(t)
+            if not t.cancelled() and t.exception() is not None:
+                logger.warning(f"Background task failed: {t.exception()}")
+        
+        task.add_done_callback(done)
+    
+    async def _ee_get(self, computed):
+        """Evaluate an EE computed object (getInfo) off the event loop."""
+        return await self._ee_call(computed.getInfo)
+    
+    async def _prewarm_tile(self, url_format: str):
+        """Fetch the root tile so the connection and EE tile cache are hot."""
+        if self._http is None:
+            return
+        try:
+            url = url_format.format(z=0, x=0, y=0)
+            await self._http.get(url)
+        except Exception as e:
+            logger.debug(f"Tile pre-warm failed: {e}")
+    
+    async def get_features(self, lat: float, lon: float) -> LocationFeatures:
         """
         Get all features for a location from GEE.
         
@@ -74,106 +580,292 @@ class GEEService:
             lon: Longitude
             
         Returns:
-            Dictionary of features
+            LocationFeatures for the point
         """
         if not self.initialized:
             raise RuntimeError("GEE not initialized")
         
+        cache_key = f"{round(lat, 2)}:{round(lon, 2)}"
+        cached = await self._feature_cache.get(cache_key)
+        if cached is not None:
+            return LocationFeatures(**cached)
+        
+        # Concurrent misses for the same grid cell share one fetch
+        return await self._single_flight(
+            f"features:{cache_key}", lambda: self._fetch_features(lat, lon, cache_key)
+        )
+    
+    async def _fetch_features(self, lat: float, lon: float, cache_key: str) -> LocationFeatures:
+        """Fetch features for a point on a feature cache miss, and cache them."""
         point = ee.Geometry.Point([lon, lat])
         
-        # Fetch all features in parallel
-        features = {}
+        features = None
+        if self.feature_asset:
+            features = await self._get_grid_features(point)
+        if not features:
+            features = await self._get_live_features(point)
+        
+        # Calculate TWI (Topographic Wetness Index) from the specific
+        # catchment area: upstream area (km²) per unit contour width (m)
+        upa_km2 = max(features.pop('upa', None) or 1.0, 1.0)
+        catchment_area = upa_km2 * 1e6 / _MERIT_SCALE
+        twi = float(topographic_wetness_index(features['slope'], catchment_area))
+        features = LocationFeatures(
+            elevation=float(features['elevation']),
+            slope=float(features['slope']),
+            precip_mean=float(features['precip_mean']),
+            temp_mean=float(features['temp_mean']),
+            ndvi=float(features['ndvi']),
+            landcover=int(features['landcover']),
+            twi=twi
+        )
+        
+        await self._feature_cache.set(cache_key, features.to_dict())
         
-        # 1. Elevation and terrain
-        dem = ee.Image('USGS/SRTMGL1_003')
-        elevation = dem.select('elevation').reduceRegion(
-            reducer=ee.Reducer.first(),
-            geometry=point,
-            scale=30
-        ).getInfo()
+        logger.info(f"Fetched features for ({lat}, {lon}): {features}")
+        return features
+    
+    async def _get_grid_features(self, point) -> Dict[str, float]:
+        """Look up features from the precomputed grid asset (empty if no cell)."""
+        if self._grid is None:
+            self._grid = ee.FeatureCollection(self.feature_asset)
+        
+        # Grid cells are stored as pixel-centre points, so search within one cell
+        cell = self._grid.filterBounds(point.buffer(self.grid_scale_m)).first()
+        return await self._ee_get(ee.Algorithms.If(
+            cell,
+            ee.Feature(cell).toDictionary(_GRID_FEATURE_KEYS),
+            ee.Dictionary()
+        ))
+    
+    def _feature_layers(self, geometry, s2_limit: Optional[int] = None) -> List[Tuple[Any, str, int]]:
+        """
+        Source layers for the model features, as (image, band, scale) triples.
         
-        slope = ee.Terrain.slope(dem).reduceRegion(
-            reducer=ee.Reducer.first(),
-            geometry=point,
-            scale=30
-        ).getInfo()
+        Args:
+            geometry: Point or collection the layers will be sampled at
+            s2_limit: Keep only the most recent N Sentinel-2 scenes (None for all)
+        """
+        end_date = datetime.now()
+        start_date = (end_date - timedelta(days=365)).strftime('%Y-%m-%d')
+        s2_start = (end_date - timedelta(days=180)).strftime('%Y-%m-%d')
+        end_date = end_date.strftime('%Y-%m-%d')
         
-        features['elevation'] = elevation.get('elevation', 1500)
-        features['slope'] = slope.get('slope', 5.0)
+        # 1. Elevation and terrain
+        dem = self._dem.select('elevation')
         
         # 2. Precipitation (CHIRPS - last year)
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=365)
+        precip = self._chirps \
+            .filterDate(start_date, end_date) \
+            .filterBounds(geometry) \
+            .sum()
         
-        chirps = ee.ImageCollection('UCSB-CHG/CHIRPS/DAILY') \
-            .filterDate(start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d')) \
-            .filterBounds(point)
+        # 3. Temperature (ERA5 - last year mean)
+        temp = self._era5 \
+            .filterDate(start_date, end_date) \
+            .filterBounds(geometry) \
+            .mean()
         
-        precip = chirps.sum().reduceRegion(
-            reducer=ee.Reducer.first(),
-            geometry=point,
-            scale=5000
-        ).getInfo()
+        # 4. NDVI (Sentinel-2 - last 6 months)
+        s2 = self._s2 \
+            .filterDate(s2_start, end_date) \
+            .filterBounds(geometry) \
+            .filter(ee.Filter.lt('CLOUDY_PIXEL_PERCENTAGE', 20))
+        if s2_limit:
+            s2 = s2.limit(s2_limit, 'system:time_start', False)
+        
+        ndvi = s2.map(compute_ndvi).mean()
+        
+        # 5. Land cover, 6. upstream drainage area (MERIT Hydro) for TWI
+        # Scales are each source's native pixel size, so a point reduction
+        # reads the one pixel under the point without resampling.
+        return [
+            (dem, 'elevation', 30),
+            (self._slope, 'slope', 30),
+            (precip, 'precipitation', 5000),
+            (temp, 'mean_2m_air_temperature', 27830),
+            (ndvi, 'NDVI', 10),
+            (self._worldcover, 'Map', 10),
+            (self._upa, 'upa', _MERIT_SCALE)
+        ]
+    
+    async def _get_live_features(self, point) -> Dict[str, float]:
+        """Reduce every source collection at the point."""
+        # Build every per-point reduction server-side and merge them (keyed by
+        # band name) over the defaults so the result always carries every key;
+        # nothing is fetched until the single getInfo() below.
+        reduced = ee.Dictionary(_FEATURE_DEFAULTS)
+        for image, _, scale in self._feature_layers(point, self.s2_limit):
+            reduced = reduced.combine(image.reduceRegion(
+                reducer=ee.Reducer.mean(),
+                geometry=point,
+                scale=scale
+            ), overwrite=True)
+        values = await self._ee_get(reduced)
         
-        features['precip_mean'] = precip.get('precipitation', 800)
+        # Convert from Kelvin to Celsius
+        temp_k = values['mean_2m_air_temperature']
+        
+        features = {
+            'elevation': values['elevation'],
+            'slope': values['slope'],
+            'precip_mean': values['precipitation'],
+            'temp_mean': temp_k - 273.15 if temp_k > 200 else 20.0,
+            'ndvi': values['NDVI'],
+            'landcover': values['Map'],
+            'upa': values['upa']
+        }
         
-        # 3. Temperature (ERA5 - last year mean)
-        era5 = ee.ImageCollection('ECMWF/ERA5/MONTHLY') \
-            .filterDate(start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d')) \
-            .filterBounds(point) \
-            .select('mean_2m_air_temperature')
+        return features
+    
+    async def get_features_bulk(self, points: np.ndarray) -> List[LocationFeatures]:
+        """
+        Get features for many locations in a single Earth Engine request.
         
-        temp = era5.mean().reduceRegion(
-            reducer=ee.Reducer.first(),
-            geometry=point,
-            scale=27830
-        ).getInfo()
+        Each source layer is sampled at every point with reduceRegions, which
+        keeps the properties already on the features, so the layers chain
+        without a join. Derived values are then computed over whole columns.
         
-        # Convert from Kelvin to Celsius
-        temp_k = temp.get('mean_2m_air_temperature', 293)
-        features['temp_mean'] = temp_k - 273.15 if temp_k > 200 else 20.0
+        Args:
+            points: Array of shape (N, 2) with (lat, lon) rows
+            
+        Returns:
+            LocationFeatures per point, in input order
+        """
+        if not self.initialized:
+            raise RuntimeError("GEE not initialized")
         
-        # 4. NDVI (Sentinel-2 - last 6 months)
-        s2_start = end_date - timedelta(days=180)
-        s2 = ee.ImageCollection('COPERNICUS/S2_SR') \
-            .filterDate(s2_start.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d')) \
-            .filterBounds(point) \
-            .filter(ee.Filter.lt('CLOUDY_PIXEL_PERCENTAGE', 20))
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        if len(points) == 0:
+            return []
+        
+        fc = ee.FeatureCollection([
+            ee.Feature(ee.Geometry.Point([lon, lat]), {'id': i})
+            for i, (lat, lon) in enumerate(points.tolist())
+        ])
+        
+        layers = self._feature_layers(fc)
+        sampled = fc
+        for image, band, scale in layers:
+            sampled = image.select(band).reduceRegions(
+                collection=sampled,
+                reducer=ee.Reducer.mean().setOutputs([band]),
+                scale=scale
+            )
         
-        def calculate_ndvi(image):
-            ndvi = image.normalizedDifference(['B8', 'B4']).rename('NDVI')
-            return image.addBands(ndvi)
+        columns = ['id'] + [band for _, band, _ in layers]
+        table = await self._ee_get(sampled.select(columns, None, False))
+        rows = [feature['properties'] for feature in table['features']]
+        
+        # Masked samples come back without the property; fill from defaults
+        order = np.fromiter((row['id'] for row in rows), dtype=np.int64, count=len(rows))
+        
+        def column(band):
+            values = np.full(len(points), np.nan)
+            values[order] = [
+                np.nan if row.get(band) is None else row[band] for row in rows
+            ]
+            return np.where(np.isnan(values), _FEATURE_DEFAULTS[band], values)
+        
+        temp_k = column('mean_2m_air_temperature')
+        temp_c = np.where(temp_k > 200, temp_k - 273.15, 20.0)
+        slope = column('slope')
+        catchment_area = np.maximum(column('upa'), 1.0) * 1e6 / _MERIT_SCALE
+        twi = topographic_wetness_index(slope, catchment_area)
+        
+        return [
+            LocationFeatures(
+                elevation=float(elevation),
+                slope=float(slope_deg),
+                precip_mean=float(precip),
+                temp_mean=float(temp),
+                ndvi=float(ndvi),
+                landcover=int(landcover),
+                twi=float(wetness)
+            )
+            for elevation, slope_deg, precip, temp, ndvi, landcover, wetness in zip(
+                column('elevation'), slope, column('precipitation'), temp_c,
+                column('NDVI'), column('Map'), twi
+            )
+        ]
+    
+    def build_feature_asset(self, asset_id: str, grid_scale_m: int = 1000) -> str:
+        """
+        Start a batch export of the Kenya feature grid to an EE table asset.
         
-        s2_ndvi = s2.map(calculate_ndvi).select('NDVI').mean()
+        Offline job: run once (or on a schedule), then point GEE_FEATURE_ASSET
+        at the asset so get_features serves cells by lookup instead of
+        reducing every collection per request.
         
-        ndvi = s2_ndvi.reduceRegion(
-            reducer=ee.Reducer.first(),
-            geometry=point,
-            scale=10
-        ).getInfo()
-        
-        features['ndvi'] = ndvi.get('NDVI', 0.5)
-        
-        # 5. Calculate TWI (Topographic Wetness Index)
-        # TWI = ln(a / tan(slope))
-        # Simplified calculation
-        slope_rad = features['slope'] * 3.14159 / 180
-        tan_slope = max(0.001, slope_rad)  # Avoid division by zero
-        catchment_area = 100  # Simplified
-        features['twi'] = float(np.log(catchment_area / tan_slope))
-        
-        # 6. Land cover
-        landcover = ee.ImageCollection('ESA/WorldCover/v100').first()
-        lc = landcover.reduceRegion(
-            reducer=ee.Reducer.first(),
-            geometry=point,
-            scale=10
-        ).getInfo()
+        Args:
+            asset_id: Destination asset (e.g. projects/<project>/assets/kenya_features)
+            grid_scale_m: Grid resolution in meters
+            
+        Returns:
+            Earth Engine task ID
+        """
+        if not self.initialized:
+            raise RuntimeError("GEE not initialized")
         
-        features['landcover'] = lc.get('Map', 50)
+        region = ee.Geometry.Rectangle(self.region_bounds)
+        end_date = datetime.now()
+        start_date = (end_date - timedelta(days=365)).strftime('%Y-%m-%d')
+        end_date = end_date.strftime('%Y-%m-%d')
         
-        logger.info(f"Fetched features for ({lat}, {lon}): {features}")
-        return features
+        dem = self._dem
+        
+        precip = self._chirps \
+            .filterDate(start_date, end_date) \
+            .select('precipitation') \
+            .sum() \
+            .rename('precip_mean')
+        
+        temp = self._era5 \
+            .filterDate(start_date, end_date) \
+            .mean() \
+            .subtract(273.15) \
+            .rename('temp_mean')
+        
+        ndvi = self._s2 \
+            .filterDate(start_date, end_date) \
+            .filterBounds(region) \
+            .filter(ee.Filter.lt('CLOUDY_PIXEL_PERCENTAGE', 20)) \
+            .map(compute_ndvi) \
+            .median() \
+            .rename('ndvi')
+        
+        landcover = self._worldcover \
+            .select('Map') \
+            .rename('landcover')
+        
+        upa = self._upa
+        
+        stack = ee.Image.cat([
+            dem.select('elevation'),
+            self._slope,
+            precip,
+            temp,
+            ndvi,
+            landcover,
+            upa
+        ])
+        
+        grid = stack.sample(
+            region=region,
+            scale=grid_scale_m,
+            geometries=True,
+            tileScale=4
+        )
+        
+        task = ee.batch.Export.table.toAsset(
+            collection=grid,
+            description='aquapredict_feature_grid',
+            assetId=asset_id
+        )
+        task.start()
+        
+        logger.info(f"Started feature grid export to {asset_id} (task {task.id})")
+        return task.id
     
     async def get_climate_timeseries(
         self,
@@ -195,66 +887,88 @@ class GEEService:
         if not self.initialized:
             raise RuntimeError("GEE not initialized")
         
+        # Same ~1 km grid as the feature cache; the month rolls the key over
+        # when a new complete month becomes available
+        now = datetime.now()
+        cache_key = f"{round(lat, 2)}:{round(lon, 2)}:{months_back}:{now:%Y-%m}"
+        cached = await self._climate_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        # Concurrent misses for the same grid cell share one fetch
+        return await self._single_flight(
+            f"climate:{cache_key}",
+            lambda: self._fetch_climate_timeseries(lat, lon, months_back, now, cache_key)
+        )
+    
+    async def _fetch_climate_timeseries(
+        self,
+        lat: float,
+        lon: float,
+        months_back: int,
+        now: datetime,
+        cache_key: str
+    ) -> Dict[str, List[float]]:
+        """Fetch a point's monthly climate series on a cache miss, and cache it."""
         point = ee.Geometry.Point([lon, lat])
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=months_back * 30)
-        
-        # Get monthly precipitation
-        chirps = ee.ImageCollection('UCSB-CHG/CHIRPS/DAILY') \
-            .filterDate(start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d')) \
-            .filterBounds(point)
-        
-        # Aggregate by month
-        months = ee.List.sequence(0, months_back - 1)
-        
-        def monthly_precip(month_offset):
-            month_start = end_date - timedelta(days=(months_back - month_offset) * 30)
-            month_end = month_start + timedelta(days=30)
-            
-            monthly = chirps.filterDate(
-                month_start.strftime('%Y-%m-%d'),
-                month_end.strftime('%Y-%m-%d')
-            ).sum()
-            
-            return monthly.reduceRegion(
-                reducer=ee.Reducer.first(),
-                geometry=point,
-                scale=5000
-            ).get('precipitation')
-        
-        precip_list = months.map(monthly_precip).getInfo()
         
-        # Get monthly temperature
-        era5 = ee.ImageCollection('ECMWF/ERA5/MONTHLY') \
-            .filterDate(start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d')) \
-            .filterBounds(point) \
-            .select('mean_2m_air_temperature')
-        
-        def monthly_temp(month_offset):
-            month_start = end_date - timedelta(days=(months_back - month_offset) * 30)
-            month_end = month_start + timedelta(days=30)
+        # Calendar months ending with the last complete month
+        start = ee.Date.fromYMD(now.year, now.month, 1).advance(-months_back, 'month')
+        month_starts = ee.List.sequence(0, months_back - 1).map(
+            lambda i: start.advance(ee.Number(i), 'month')
+        )
+        
+        def monthly_series(collection, band, reducer):
+            """One composite per month, built entirely server-side."""
+            # A fully masked placeholder keeps empty months in the series as nulls
+            empty = ee.ImageCollection([
+                ee.Image.constant(0).toFloat().rename(band).updateMask(0)
+            ])
             
-            monthly = era5.filterDate(
-                month_start.strftime('%Y-%m-%d'),
-                month_end.strftime('%Y-%m-%d')
-            ).mean()
+            def composite(month_start):
+                month_start = ee.Date(month_start)
+                return collection \
+                    .filterDate(month_start, month_start.advance(1, 'month')) \
+                    .merge(empty) \
+                    .reduce(reducer) \
+                    .rename(band) \
+                    .set('system:time_start', month_start.millis())
             
-            temp_k = monthly.reduceRegion(
-                reducer=ee.Reducer.first(),
-                geometry=point,
-                scale=27830
-            ).get('mean_2m_air_temperature')
-            
-            # Convert to Celsius
-            return ee.Number(temp_k).subtract(273.15)
-        
-        temp_list = months.map(monthly_temp).getInfo()
-        
-        return {
+            return ee.ImageCollection.fromImages(month_starts.map(composite))
+        
+        precip = monthly_series(
+            self._chirps.filterBounds(point).select('precipitation'),
+            'precipitation',
+            ee.Reducer.sum()
+        )
+        temp = monthly_series(
+            self._era5.filterBounds(point),
+            'mean_2m_air_temperature',
+            ee.Reducer.mean()
+        )
+        
+        # Both series are independent; sample them concurrently
+        precip_rows, temp_rows = await asyncio.gather(
+            self._ee_get(precip.getRegion(point, 5000)),
+            self._ee_get(temp.getRegion(point, 27830))
+        )
+        
+        def ordered_values(rows, band):
+            header = rows[0]
+            time_idx, value_idx = header.index('time'), header.index(band)
+            return [row[value_idx] for row in sorted(rows[1:], key=lambda r: r[time_idx])]
+        
+        precip_list = ordered_values(precip_rows, 'precipitation')
+        temp_list = ordered_values(temp_rows, 'mean_2m_air_temperature')
+        
+        series = {
             'precipitation': [p if p else 50 for p in precip_list],
-            'temperature': [t if t else 20 for t in temp_list],
+            # Convert Kelvin to Celsius
+            'temperature': [t - 273.15 if t else 20 for t in temp_list],
             'months': months_back
         }
+        await self._climate_cache.set(cache_key, series)
+        return series
     
     async def get_regional_data(
         self,
@@ -277,16 +991,17 @@ class GEEService:
         region = ee.Geometry.Rectangle(bbox)
         
         # Get elevation statistics
-        dem = ee.Image('USGS/SRTMGL1_003')
-        elev_stats = dem.reduceRegion(
+        dem = self._dem
+        elev_stats = await self._ee_get(dem.reduceRegion(
             reducer=ee.Reducer.mean().combine(
                 ee.Reducer.minMax(),
                 sharedInputs=True
             ),
             geometry=region,
             scale=scale,
-            maxPixels=1e9
-        ).getInfo()
+            maxPixels=1e9,
+            tileScale=tile_scale_for(scale)
+        ))
         
         return {
             'elevation': {
@@ -317,72 +1032,38 @@ class GEEService:
         if not self.initialized:
             raise RuntimeError("GEE not initialized")
         
-        # Dataset configurations
-        dataset_configs = {
-            'chirps': {
-                'collection': 'UCSB-CHG/CHIRPS/DAILY',
-                'band': 'precipitation',
-                'vis_params': {
-                    'min': 1,
-                    'max': 17,
-                    'palette': ['001137', '0aab1e', 'e7eb05', 'ff4a2d', 'e90000']
-                },
-                'temporal': True
-            },
-            'era5': {
-                'collection': 'ECMWF/ERA5/MONTHLY',
-                'band': 'mean_2m_air_temperature',
-                'vis_params': {
-                    'min': 250,
-                    'max': 320,
-                    'palette': ['000080', '0000ff', '00ffff', 'ffff00', 'ff0000', '800000']
-                },
-                'temporal': True
-            },
-            'srtm': {
-                'collection': 'USGS/SRTMGL1_003',
-                'band': 'elevation',
-                'vis_params': {
-                    'min': 0,
-                    'max': 3000,
-                    'palette': ['006633', 'E5FFCC', '662A00', 'D8D8D8', 'F5F5F5']
-                },
-                'temporal': False
-            },
-            'sentinel2': {
-                'collection': 'COPERNICUS/S2_SR',
-                'band': 'NDVI',
-                'vis_params': {
-                    'min': -1,
-                    'max': 1,
-                    'palette': ['brown', 'yellow', 'green', 'darkgreen']
-                },
-                'temporal': True,
-                'compute_ndvi': True
-            },
-            'worldcover': {
-                'collection': 'ESA/WorldCover/v100',
-                'band': 'Map',
-                'vis_params': {
-                    'min': 10,
-                    'max': 100,
-                    'palette': ['006400', 'ffbb22', 'ffff4c', 'f096ff', 'fa0000', 
-                               'b4b4b4', 'f0f0f0', '0064c8', '0096a0', '00cf75', 'fae6a0']
-                },
-                'temporal': False
-            }
-        }
-        
-        if dataset_id not in dataset_configs:
+        if dataset_id not in _DATASET_CONFIGS:
             raise ValueError(f"Unknown dataset: {dataset_id}")
         
-        config = dataset_configs[dataset_id]
+        config = _DATASET_CONFIGS[dataset_id]
+        
+        # Serve a still-valid template without rebuilding the image graph
+        cache_key = f"{dataset_id}:{start_date}:{end_date}"
+        cache = self._tile_url_cache if config['temporal'] else self._static_tile_url_cache
+        cached = await cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        # Concurrent identical requests share one map ID request
+        return await self._single_flight(
+            f"tile:{cache_key}",
+            lambda: self._create_tile_url(dataset_id, start_date, end_date, cache_key)
+        )
+    
+    async def _create_tile_url(
+        self,
+        dataset_id: str,
+        start_date: Optional[str],
+        end_date: Optional[str],
+        cache_key: str
+    ) -> str:
+        """Create a tile URL template on a cache miss, and cache it."""
+        config = _DATASET_CONFIGS[dataset_id]
         
         # Get image or image collection
         if config['temporal']:
             if not start_date or not end_date:
                 # Use default recent dates
-                from datetime import datetime, timedelta
                 end = datetime.now()
                 start = end - timedelta(days=30)
                 start_date = start.strftime('%Y-%m-%d')
@@ -394,18 +1075,16 @@ class GEEService:
             
             # Special handling for Sentinel-2 NDVI
             if config.get('compute_ndvi'):
-                def calculate_ndvi(img):
-                    ndvi = img.normalizedDifference(['B8', 'B4']).rename('NDVI')
-                    return ndvi
-                
                 collection = ee.ImageCollection(config['collection']) \
                     .filterDate(start_date, end_date) \
                     .filter(ee.Filter.lt('CLOUDY_PIXEL_PERCENTAGE', 20)) \
-                    .map(calculate_ndvi)
+                    .limit(self.s2_tile_limit, 'system:time_start', False) \
+                    .map(compute_ndvi)
             
-            # Check if collection has images
-            count = collection.size().getInfo()
-            if count == 0:
+            # Existence probe: limit(1) stops at the first image instead of
+            # counting the whole collection
+            has_images = await self._ee_get(collection.limit(1).size())
+            if not has_images:
                 raise ValueError(f"No images found for {dataset_id} in the specified date range")
             
             # Get most recent image (avoids band naming issues with mean/median)
@@ -422,9 +1101,17 @@ class GEEService:
             raise ValueError(f"Failed to create image for {dataset_id}")
         
         # Get map ID for tiles
-        map_id = image.getMapId(config['vis_params'])
+        vis_params = dict(config['vis_params'])
+        map_id = await self._ee_call(image.getMapId, vis_params)
+        url_format = map_id['tile_fetcher'].url_format
+        
+        cache = self._tile_url_cache if config['temporal'] else self._static_tile_url_cache
+        await cache.set(cache_key, url_format)
+        
+        # Warm the tile endpoint in the background; don't hold up the response
+        self._run_in_background(self._prewarm_tile(url_format))
         
-        return map_id['tile_fetcher'].url_format
+        return url_format
     
     async def get_dataset_stats(
         self,
@@ -448,21 +1135,32 @@ class GEEService:
         if not self.initialized:
             raise RuntimeError("GEE not initialized")
         
-        point = ee.Geometry.Point([location['lon'], location['lat']])
+        lat, lon = location['lat'], location['lon']
+        cache_key = f"{dataset_id}:{round(lat, 2)}:{round(lon, 2)}:{start_date}:{end_date}"
+        cached = await self._stats_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        point = ee.Geometry.Point([lon, lat])
         
         # Dataset-specific statistics
         if dataset_id == 'chirps':
-            return await self._get_chirps_stats(point, start_date, end_date)
+            stats = await self._get_chirps_stats(point, start_date, end_date)
         elif dataset_id == 'era5':
-            return await self._get_era5_stats(point, start_date, end_date)
+            stats = await self._get_era5_stats(point, start_date, end_date)
         elif dataset_id == 'srtm':
-            return await self._get_srtm_stats(point)
+            stats = await self._get_srtm_stats(point)
         elif dataset_id == 'sentinel2':
-            return await self._get_sentinel2_stats(point, start_date, end_date)
+            stats = await self._get_sentinel2_stats(point, start_date, end_date)
         elif dataset_id == 'worldcover':
-            return await self._get_worldcover_stats(point)
+            stats = await self._get_worldcover_stats(point)
         else:
             raise ValueError(f"Unknown dataset: {dataset_id}")
+        
+        # Don't pin empty/failed lookups for a day
+        if 'error' not in stats:
+            await self._stats_cache.set(cache_key, stats)
+        return stats
     
     async def _get_chirps_stats(self, point, start_date, end_date):
         """Get CHIRPS precipitation statistics."""
@@ -472,13 +1170,16 @@ class GEEService:
             start_date = start.strftime('%Y-%m-%d')
             end_date = end.strftime('%Y-%m-%d')
         
-        collection = ee.ImageCollection('UCSB-CHG/CHIRPS/DAILY') \
+        collection = self._chirps \
             .filterDate(start_date, end_date) \
             .filterBounds(point) \
             .select('precipitation')
         
-        # Check if collection has images
-        count = collection.size().getInfo()
+        # Image count and point samples in a single request
+        count, dates, all_values = await self._sample_point_series(
+            collection, point, 5000, 'precipitation',
+            date_range=(start_date, end_date), window_days=_SERIES_WINDOW_DAYS
+        )
         if count == 0:
             return {
                 'min': 0,
@@ -492,18 +1193,6 @@ class GEEService:
                 'error': 'No images found for date range'
             }
         
-        # Calculate statistics at the point
-        def get_stats(img):
-            return img.reduceRegion(
-                reducer=ee.Reducer.first(),
-                geometry=point,
-                scale=5000
-            )
-        
-        # Get all values
-        all_values = collection.map(get_stats).aggregate_array('precipitation').getInfo()
-        all_values = [v for v in all_values if v is not None]
-        
         if len(all_values) == 0:
             return {
                 'min': 0,
@@ -517,44 +1206,17 @@ class GEEService:
                 'error': 'No valid data at location'
             }
         
-        import numpy as np
-        stats = {
-            'precipitation_min': float(np.min(all_values)),
-            'precipitation_max': float(np.max(all_values)),
-            'precipitation_mean': float(np.mean(all_values)),
-            'precipitation_stdDev': float(np.std(all_values))
-        }
-        
-        # Get time series (limit to last 30 days for performance)
-        recent_collection = collection.limit(30, 'system:time_start', False)
-        
-        def extract_value(image):
-            value = image.reduceRegion(
-                reducer=ee.Reducer.first(),
-                geometry=point,
-                scale=5000
-            ).get('precipitation')
-            return ee.Feature(None, {
-                'date': image.date().format('YYYY-MM-dd'),
-                'value': value
-            })
+        stats = summarize_series(all_values)
         
-        time_series = recent_collection.map(extract_value).getInfo()
-        
-        # Extract time series data
-        dates = []
-        values = []
-        for feature in time_series['features']:
-            props = feature['properties']
-            if props.get('value') is not None:
-                dates.append(props['date'])
-                values.append(float(props['value']))
+        # Time series of the last 30 days, most recent first
+        dates = dates[::-1][:30]
+        values = all_values[::-1][:30]
         
         return {
-            'min': stats.get('precipitation_min', 0),
-            'max': stats.get('precipitation_max', 0),
-            'mean': stats.get('precipitation_mean', 0),
-            'std': stats.get('precipitation_stdDev', 0),
+            'min': stats['min'],
+            'max': stats['max'],
+            'mean': stats['mean'],
+            'std': stats['std'],
             'unit': 'mm/day',
             'time_series': {
                 'dates': dates,
@@ -572,12 +1234,13 @@ class GEEService:
             start_date = start.strftime('%Y-%m-%d')
             end_date = end.strftime('%Y-%m-%d')
         
-        collection = ee.ImageCollection('ECMWF/ERA5/MONTHLY') \
+        collection = self._era5 \
             .filterDate(start_date, end_date) \
-            .filterBounds(point) \
-            .select('mean_2m_air_temperature')
+            .filterBounds(point)
         
-        count = collection.size().getInfo()
+        count, _, temp_values = await self._sample_point_series(
+            collection, point, 27830, 'mean_2m_air_temperature'
+        )
         if count == 0:
             return {
                 'min': 0,
@@ -589,17 +1252,6 @@ class GEEService:
                 'error': 'No images found'
             }
         
-        # Get temperature values at point
-        def get_temp(img):
-            return img.reduceRegion(
-                reducer=ee.Reducer.first(),
-                geometry=point,
-                scale=27830
-            )
-        
-        temp_values = collection.map(get_temp).aggregate_array('mean_2m_air_temperature').getInfo()
-        temp_values = [v for v in temp_values if v is not None]
-        
         if len(temp_values) == 0:
             return {
                 'min': 0,
@@ -611,34 +1263,91 @@ class GEEService:
                 'error': 'No valid data at location'
             }
         
-        import numpy as np
         # Convert Kelvin to Celsius
+        stats = summarize_series(temp_values, offset=-273.15)
         return {
-            'min': float(np.min(temp_values)) - 273.15,
-            'max': float(np.max(temp_values)) - 273.15,
-            'mean': float(np.mean(temp_values)) - 273.15,
+            'min': stats['min'],
+            'max': stats['max'],
+            'mean': stats['mean'],
             'unit': '°C',
             'total_images': count,
             'date_range': [start_date, end_date]
         }
     
+    async def _sample_point_series(
+        self, collection, point, scale, band, date_range=None, window_days=None
+    ):
+        """
+        Count a collection and sample every image at a point.
+        
+        Long date ranges can be split into windows of window_days, fetched
+        concurrently, so no single getRegion response grows with the range.
+        
+        Args:
+            collection: Date-filtered image collection
+            point: Sample location
+            scale: Sampling scale in meters
+            band: Band to read
+            date_range: (start_date, end_date) the collection covers
+            window_days: Split longer ranges into windows of this many days
+        
+        Returns:
+            (count, dates, values) with dates/values in chronological order,
+            skipping masked samples
+        """
+        windows = [collection]
+        if date_range and window_days:
+            start = datetime.strptime(date_range[0][:10], '%Y-%m-%d')
+            end = datetime.strptime(date_range[1][:10], '%Y-%m-%d')
+            if (end - start).days > window_days:
+                windows = []
+                while start < end:
+                    stop = min(start + timedelta(days=window_days), end)
+                    windows.append(collection.filterDate(
+                        start.strftime('%Y-%m-%d'), stop.strftime('%Y-%m-%d')
+                    ))
+                    start = stop
+        
+        results = await asyncio.gather(*(
+            self._ee_get(ee.Dictionary({
+                'count': window.size(),
+                'rows': window.getRegion(point, scale)
+            }))
+            for window in windows
+        ))
+        
+        count = 0
+        samples = []
+        for result in results:
+            header, rows = result['rows'][0], result['rows'][1:]
+            time_idx, value_idx = header.index('time'), header.index(band)
+            count += result['count']
+            samples.extend(
+                (row[time_idx], row[value_idx]) for row in rows if row[value_idx] is not None
+            )
+        
+        samples.sort()
+        dates = [datetime.utcfromtimestamp(t / 1000).strftime('%Y-%m-%d') for t, _ in samples]
+        values = [float(v) for _, v in samples]
+        return count, dates, values
+    
     async def _get_srtm_stats(self, point):
         """Get SRTM elevation statistics."""
-        dem = ee.Image('USGS/SRTMGL1_003')
+        dem = self._dem
         
         # Get elevation at point
         elevation = dem.reduceRegion(
-            reducer=ee.Reducer.first(),
+            reducer=ee.Reducer.mean(),
             geometry=point,
             scale=30
-        ).getInfo()
+        )
         
         # Get slope
-        slope = ee.Terrain.slope(dem).reduceRegion(
-            reducer=ee.Reducer.first(),
+        slope = self._slope.reduceRegion(
+            reducer=ee.Reducer.mean(),
             geometry=point,
             scale=30
-        ).getInfo()
+        )
         
         # Get regional statistics (10km buffer)
         buffer = point.buffer(10000)
@@ -648,14 +1357,18 @@ class GEEService:
             ),
             geometry=buffer,
             scale=90
-        ).getInfo()
+        )
+        
+        # Keys don't collide (elevation, slope, elevation_min/max/mean),
+        # so fetch all three reductions in one round-trip
+        stats = await self._ee_get(elevation.combine(slope).combine(regional_stats))
         
         return {
-            'elevation': elevation.get('elevation', 0),
-            'slope': slope.get('slope', 0),
-            'regional_min': regional_stats.get('elevation_min', 0),
-            'regional_max': regional_stats.get('elevation_max', 0),
-            'regional_mean': regional_stats.get('elevation_mean', 0),
+            'elevation': stats.get('elevation', 0),
+            'slope': stats.get('slope', 0),
+            'regional_min': stats.get('elevation_min', 0),
+            'regional_max': stats.get('elevation_max', 0),
+            'regional_mean': stats.get('elevation_mean', 0),
             'unit': 'meters',
             'resolution': '30m'
         }
@@ -668,18 +1381,14 @@ class GEEService:
             start_date = start.strftime('%Y-%m-%d')
             end_date = end.strftime('%Y-%m-%d')
         
-        def calculate_ndvi(image):
-            ndvi = image.normalizedDifference(['B8', 'B4']).rename('NDVI')
-            return image.addBands(ndvi)
-        
-        collection = ee.ImageCollection('COPERNICUS/S2_SR') \
+        collection = self._s2 \
             .filterDate(start_date, end_date) \
             .filterBounds(point) \
             .filter(ee.Filter.lt('CLOUDY_PIXEL_PERCENTAGE', 20)) \
-            .map(calculate_ndvi) \
+            .map(compute_ndvi) \
             .select('NDVI')
         
-        count = collection.size().getInfo()
+        count, _, ndvi_values = await self._sample_point_series(collection, point, 10, 'NDVI')
         if count == 0:
             return {
                 'min': -1,
@@ -693,17 +1402,6 @@ class GEEService:
                 'error': 'No cloud-free images found'
             }
         
-        # Get NDVI values at point
-        def get_ndvi(img):
-            return img.reduceRegion(
-                reducer=ee.Reducer.first(),
-                geometry=point,
-                scale=10
-            )
-        
-        ndvi_values = collection.map(get_ndvi).aggregate_array('NDVI').getInfo()
-        ndvi_values = [v for v in ndvi_values if v is not None]
-        
         if len(ndvi_values) == 0:
             return {
                 'min': -1,
@@ -717,68 +1415,44 @@ class GEEService:
                 'error': 'No valid data at location'
             }
         
-        import numpy as np
-        mean_ndvi = float(np.mean(ndvi_values))
+        stats = summarize_series(ndvi_values)
         
         return {
-            'min': float(np.min(ndvi_values)),
-            'max': float(np.max(ndvi_values)),
-            'mean': mean_ndvi,
-            'std': float(np.std(ndvi_values)),
+            'min': stats['min'],
+            'max': stats['max'],
+            'mean': stats['mean'],
+            'std': stats['std'],
             'unit': 'index (-1 to 1)',
             'total_images': count,
             'date_range': [start_date, end_date],
-            'interpretation': self._interpret_ndvi(mean_ndvi)
+            'interpretation': self._interpret_ndvi(stats['mean'])
         }
     
     async def _get_worldcover_stats(self, point):
         """Get ESA WorldCover land cover statistics."""
-        worldcover = ee.ImageCollection('ESA/WorldCover/v100').first()
+        worldcover = self._worldcover
         
         # Get land cover class at point
-        lc_class = worldcover.reduceRegion(
-            reducer=ee.Reducer.first(),
+        lc_class = await self._ee_get(worldcover.reduceRegion(
+            reducer=ee.Reducer.mean(),
             geometry=point,
             scale=10
-        ).getInfo()
-        
-        # Land cover classes
-        lc_names = {
-            10: 'Tree cover',
-            20: 'Shrubland',
-            30: 'Grassland',
-            40: 'Cropland',
-            50: 'Built-up',
-            60: 'Bare / sparse vegetation',
-            70: 'Snow and ice',
-            80: 'Permanent water bodies',
-            90: 'Herbaceous wetland',
-            95: 'Mangroves',
-            100: 'Moss and lichen'
-        }
+        ))
         
         class_value = int(lc_class.get('Map', 0))
         
         return {
             'class_value': class_value,
-            'class_name': lc_names.get(class_value, 'Unknown'),
+            'class_name': landcover_name(class_value),
             'unit': 'class',
             'resolution': '10m',
             'year': '2020'
         }
     
     def _interpret_ndvi(self, ndvi_value):
-        """Interpret NDVI value."""
-        if ndvi_value < 0:
-            return 'Water or snow'
-        elif ndvi_value < 0.2:
-            return 'Bare soil or rock'
-        elif ndvi_value < 0.4:
-            return 'Sparse vegetation'
-        elif ndvi_value < 0.6:
-            return 'Moderate vegetation'
-        else:
-            return 'Dense vegetation'
+        """Interpret NDVI value(s); arrays are classified in one call."""
+        labels = _NDVI_LABELS[np.searchsorted(_NDVI_BINS, ndvi_value, side='right')]
+        return labels if np.ndim(labels) else str(labels)
     
     async def get_regional_stats(
         self,
@@ -802,23 +1476,206 @@ class GEEService:
         if not self.initialized:
             raise RuntimeError("GEE not initialized")
         
+        if dataset_id not in _DATASET_CONFIGS:
+            raise ValueError(f"Unknown dataset: {dataset_id}")
+        
+        # Results are a pure function of dataset, bbox and date range; bump the
+        # version suffix whenever the computation below changes
+        temporal = _DATASET_CONFIGS[dataset_id]['temporal']
+        cache = self._regional_cache if temporal else self._static_regional_cache
+        bbox_key = ','.join(f"{v:.4f}" for v in bbox)
+        cache_key = f"{dataset_id}|{bbox_key}|{start_date}|{end_date}|v5" if temporal \
+            else f"{dataset_id}|{bbox_key}|v5"
+        cached = await cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        def fetch():
+            return self._fetch_regional_stats(
+                dataset_id, bbox, bbox_key, start_date, end_date, cache, cache_key
+            )
+        
+        # Stale-while-revalidate: an expired temporal result is returned at
+        # once while a single background refresh recomputes it
+        if temporal:
+            stale = await self._regional_stale_cache.get(cache_key)
+            if stale is not None:
+                self._run_in_background(self._single_flight(f"regional:{cache_key}", fetch))
+                return stale
+        
+        # Concurrent identical requests (e.g. a burst of previews) share one fetch
+        return await self._single_flight(f"regional:{cache_key}", fetch)
+    
+    async def _fetch_regional_stats(
+        self,
+        dataset_id: str,
+        bbox: List[float],
+        bbox_key: str,
+        start_date: Optional[str],
+        end_date: Optional[str],
+        cache: CacheService,
+        cache_key: str
+    ) -> Dict[str, Any]:
+        """Compute regional statistics on a cache miss, and cache them."""
         region = ee.Geometry.Rectangle(bbox)
         
         # Dataset-specific regional stats
         if dataset_id == 'chirps':
-            return await self._get_chirps_regional(region, start_date, end_date)
+            dataset_stats = self._get_chirps_regional(region, bbox, start_date, end_date)
         elif dataset_id == 'era5':
-            return await self._get_era5_regional(region, start_date, end_date)
+            dataset_stats = self._get_era5_regional(region, start_date, end_date)
         elif dataset_id == 'srtm':
-            return await self._get_srtm_regional(region)
+            dataset_stats = self._get_srtm_regional(region)
         elif dataset_id == 'sentinel2':
-            return await self._get_sentinel2_regional(region, start_date, end_date)
-        elif dataset_id == 'worldcover':
-            return await self._get_worldcover_regional(region)
+            dataset_stats = self._get_sentinel2_regional(region, start_date, end_date)
         else:
-            raise ValueError(f"Unknown dataset: {dataset_id}")
+            dataset_stats = self._get_worldcover_regional(region)
+        
+        # The area depends only on the bbox, so it is shared by every dataset
+        stats, area_km2 = await asyncio.gather(
+            dataset_stats, self._region_area_km2(region, bbox_key)
+        )
+        
+        if 'error' not in stats:
+            stats['region_area_km2'] = area_km2
+            await cache.set(cache_key, stats)
+            if cache is self._regional_cache:
+                await self._regional_stale_cache.set(cache_key, stats)
+        return stats
     
-    async def _get_chirps_regional(self, region, start_date, end_date):
+    async def get_regional_summary(
+        self,
+        bbox: List[float],
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        dataset_ids: Optional[List[str]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get regional statistics for several datasets at once.
+        
+        The datasets are independent, so they are fetched concurrently; a
+        failure in one is reported under its key without affecting the rest.
+        
+        Args:
+            bbox: [west, south, east, north]
+            start_date: Start date
+            end_date: End date
+            dataset_ids: Datasets to include (default: all)
+            
+        Returns:
+            Regional statistics keyed by dataset ID
+        """
+        dataset_ids = list(dataset_ids or _DATASET_CONFIGS)
+        results = await asyncio.gather(
+            *(self.get_regional_stats(d, bbox, start_date, end_date) for d in dataset_ids),
+            return_exceptions=True
+        )
+        
+        summary = {}
+        for dataset_id, result in zip(dataset_ids, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Regional stats failed for {dataset_id}: {result}")
+                result = {'error': str(result)}
+            summary[dataset_id] = result
+        return summary
+    
+    async def _region_area_km2(self, region, bbox_key: str) -> float:
+        """Area of a bbox region in km², computed once per bbox."""
+        area_km2 = await self._area_cache.get(bbox_key)
+        if area_km2 is None:
+            area_km2 = await self._ee_get(region.area().divide(1e6))
+            await self._area_cache.set(bbox_key, area_km2)
+        return area_km2
+    
+    async def _tiled_region_stats(self, key, bbox, image_fn, scale):
+        """
+        Reduce an image over the grid tiles covering a bbox, caching each tile.
+        
+        Each tile is clipped to the bbox, so the result covers exactly the
+        requested area. Tiles lying wholly inside overlapping bboxes (map
+        pans/zooms) are shared, so only tiles not seen before are sent to
+        Earth Engine, all in a single request.
+        
+        Args:
+            key: Cache key prefix (dataset and date range)
+            bbox: [west, south, east, north]
+            image_fn: Builds the image to reduce for a tile geometry
+            scale: Reduction scale in meters
+            
+        Returns:
+            Per-band {'mean', 'std', 'min', 'max'}; means are pixel-count weighted
+        """
+        tiles = {}
+        for x, y in region_tiles(bbox):
+            bounds = clip_bounds(tile_bounds(x, y), bbox)
+            if bounds is not None:
+                bounds_key = ','.join(f"{v:.4f}" for v in bounds)
+                tiles[f"{key}:{_REGION_TILE_ZOOM}/{x}/{y}:{bounds_key}"] = bounds
+        
+        results = {}
+        for tile_key in tiles:
+            cached = await self._region_tile_cache.get(tile_key)
+            if cached is not None:
+                results[tile_key] = cached
+        
+        missing = [tile_key for tile_key in tiles if tile_key not in results]
+        if missing:
+            reducer = ee.Reducer.mean() \
+                .combine(ee.Reducer.minMax(), sharedInputs=True) \
+                .combine(ee.Reducer.stdDev(), sharedInputs=True) \
+                .combine(ee.Reducer.count(), sharedInputs=True)
+            reductions = {}
+            for tile_key in missing:
+                geometry = ee.Geometry.Rectangle(tiles[tile_key])
+                reductions[tile_key] = image_fn(geometry).reduceRegion(
+                    reducer=reducer,
+                    geometry=geometry,
+                    scale=scale,
+                    maxPixels=1e9,
+                    tileScale=tile_scale_for(scale)
+                )
+            fetched = await self._ee_get(ee.Dictionary(reductions))
+            for tile_key in missing:
+                results[tile_key] = fetched[tile_key]
+                await self._region_tile_cache.set(tile_key, fetched[tile_key])
+        
+        return merge_tile_stats(list(results.values()))
+    
+    def _region_series(self, collection, region, scale, band, max_samples, date_format, spread=True):
+        """
+        Per-image regional means as a server-side list of [date, value] pairs.
+        
+        Nothing is fetched; the list is meant to be combined into the
+        caller's single getInfo(). Masked images yield a None value.
+        
+        Args:
+            collection: Image collection to sample
+            region: Geometry to average over
+            scale: Reduction scale in meters
+            band: Band to read
+            max_samples: Maximum number of images to sample
+            date_format: EE date format for the labels
+            spread: Spread samples evenly over the collection (else take the first N)
+        """
+        size = collection.size()
+        n = size.min(max_samples)
+        step = size.divide(n.max(1)).floor().max(1) if spread else ee.Number(1)
+        images = collection.toList(n.multiply(step))
+        
+        def sample(i):
+            image = ee.Image(images.get(ee.Number(i).multiply(step)))
+            value = image.reduceRegion(
+                reducer=ee.Reducer.mean(),
+                geometry=region,
+                scale=scale,
+                maxPixels=1e9,
+                tileScale=tile_scale_for(scale)
+            ).get(band)
+            return ee.List([image.date().format(date_format), value])
+        
+        return ee.List.sequence(0, n.subtract(1)).map(sample)
+    
+    async def _get_chirps_regional(self, region, bbox, start_date, end_date):
         """Get regional CHIRPS statistics."""
         if not start_date or not end_date:
             end = datetime.now()
@@ -826,65 +1683,55 @@ class GEEService:
             start_date = start.strftime('%Y-%m-%d')
             end_date = end.strftime('%Y-%m-%d')
         
-        collection = ee.ImageCollection('UCSB-CHG/CHIRPS/DAILY') \
+        collection = self._chirps \
             .filterDate(start_date, end_date) \
             .filterBounds(region) \
             .select('precipitation')
         
-        count = collection.size().getInfo()
+        # Overall statistics from per-tile cached reductions of the mean and
+        # per-pixel min/max composites
+        def composite(geometry):
+            tile_collection = self._chirps \
+                .filterDate(start_date, end_date) \
+                .filterBounds(geometry) \
+                .select('precipitation')
+            return tile_collection.mean().addBands(
+                tile_collection.reduce(ee.Reducer.minMax())
+            )
+        
+        # Image count and a 10-image time series spread over the range come
+        # back in one request, alongside the tiled stats
+        size = collection.size()
+        result, tiled = await asyncio.gather(
+            self._ee_get(ee.Dictionary({
+                'count': size,
+                'series': ee.Algorithms.If(
+                    size.gt(0),
+                    self._region_series(collection, region, 5000, 'precipitation', 10, 'YYYY-MM-dd'),
+                    ee.List([])
+                )
+            })),
+            self._tiled_region_stats(f"chirps:{start_date}:{end_date}", bbox, composite, 5000)
+        )
+        count = result['count']
         if count == 0:
             return {'error': 'No data', 'date_range': [start_date, end_date]}
+        empty = {'mean': 0, 'std': 0}
         
-        # Get overall statistics using server-side reduction (much faster)
-        mean_image = collection.mean()
-        stats = mean_image.reduceRegion(
-            reducer=ee.Reducer.mean(),
-            geometry=region,
-            scale=5000,
-            maxPixels=1e9
-        ).getInfo()
-        
-        # Get min/max from collection
-        min_max = collection.reduce(ee.Reducer.minMax()).reduceRegion(
-            reducer=ee.Reducer.mean(),
-            geometry=region,
-            scale=5000,
-            maxPixels=1e9
-        ).getInfo()
-        
-        # Get simplified time series (weekly averages for speed)
-        # Sample only 10 images evenly distributed
-        sample_size = min(10, count)
-        step = max(1, count // sample_size)
-        
-        dates = []
-        values = []
-        
-        for i in range(sample_size):
-            idx = i * step
-            img = ee.Image(collection.toList(1, idx).get(0))
-            date = img.date().format('YYYY-MM-dd').getInfo()
-            val = img.reduceRegion(
-                reducer=ee.Reducer.mean(),
-                geometry=region,
-                scale=5000,
-                maxPixels=1e9
-            ).getInfo()
-            
-            if val.get('precipitation') is not None:
-                dates.append(date)
-                values.append(float(val['precipitation']))
+        series = [(date, float(value)) for date, value in result['series'] if value is not None]
         
         return {
-            'min': min_max.get('precipitation_min', 0),
-            'max': min_max.get('precipitation_max', 0),
-            'mean': stats.get('precipitation', 0),
-            'std': 0,  # Skip std calculation for speed
+            'min': tiled.get('precipitation_min', empty)['mean'],
+            'max': tiled.get('precipitation_max', empty)['mean'],
+            'mean': tiled.get('precipitation', empty)['mean'],
+            'std': tiled.get('precipitation', empty)['std'],
             'unit': 'mm/day',
-            'time_series': {'dates': dates, 'values': values},
+            'time_series': {
+                'dates': [date for date, _ in series],
+                'values': [value for _, value in series]
+            },
             'total_images': count,
-            'date_range': [start_date, end_date],
-            'region_area_km2': region.area().divide(1e6).getInfo()
+            'date_range': [start_date, end_date]
         }
     
     async def _get_era5_regional(self, region, start_date, end_date):
@@ -895,82 +1742,82 @@ class GEEService:
             start_date = start.strftime('%Y-%m-%d')
             end_date = end.strftime('%Y-%m-%d')
         
-        collection = ee.ImageCollection('ECMWF/ERA5/MONTHLY') \
+        collection = self._era5 \
             .filterDate(start_date, end_date) \
-            .filterBounds(region) \
-            .select('mean_2m_air_temperature')
-        
-        count = collection.size().getInfo()
+            .filterBounds(region)
+        
+        # Mean and per-pixel min/max composites reduced together in one pass
+        # with a combined mean/stdDev reducer, plus up to 12 monthly samples,
+        # fused with the emptiness check into a single request
+        size = collection.size()
+        result = await self._ee_get(ee.Dictionary({
+            'count': size,
+            'stats': ee.Algorithms.If(
+                size.gt(0),
+                collection.mean().addBands(
+                    collection.reduce(ee.Reducer.minMax())
+                ).reduceRegion(
+                    reducer=ee.Reducer.mean().combine(ee.Reducer.stdDev(), sharedInputs=True),
+                    geometry=region,
+                    scale=27830,
+                    maxPixels=1e9,
+                    tileScale=_TILE_SCALE_COARSE
+                ),
+                ee.Dictionary()
+            ),
+            'series': ee.Algorithms.If(
+                size.gt(0),
+                self._region_series(
+                    collection, region, 27830, 'mean_2m_air_temperature', 12, 'YYYY-MM',
+                    spread=False
+                ),
+                ee.List([])
+            )
+        }))
+        count, stats = result['count'], result['stats']
         if count == 0:
             return {'error': 'No data', 'date_range': [start_date, end_date]}
         
-        # Get overall statistics using server-side operations
-        mean_temp = collection.mean().reduceRegion(
-            reducer=ee.Reducer.mean(),
-            geometry=region,
-            scale=27830,
-            maxPixels=1e9
-        ).getInfo()
-        
-        min_max = collection.reduce(ee.Reducer.minMax()).reduceRegion(
-            reducer=ee.Reducer.mean(),
-            geometry=region,
-            scale=27830,
-            maxPixels=1e9
-        ).getInfo()
-        
-        # Get simplified time series (sample up to 12 months)
-        sample_size = min(12, count)
-        dates = []
-        values = []
-        
-        img_list = collection.toList(sample_size, 0)
-        for i in range(sample_size):
-            img = ee.Image(img_list.get(i))
-            date = img.date().format('YYYY-MM').getInfo()
-            val = img.reduceRegion(
-                reducer=ee.Reducer.mean(),
-                geometry=region,
-                scale=27830,
-                maxPixels=1e9
-            ).getInfo()
-            
-            if val.get('mean_2m_air_temperature') is not None:
-                dates.append(date)
-                values.append(float(val['mean_2m_air_temperature']) - 273.15)
+        # Convert Kelvin to Celsius
+        series = [
+            (date, float(value) - 273.15) for date, value in result['series'] if value is not None
+        ]
         
         return {
-            'min': min_max.get('mean_2m_air_temperature_min', 273) - 273.15,
-            'max': min_max.get('mean_2m_air_temperature_max', 273) - 273.15,
-            'mean': mean_temp.get('mean_2m_air_temperature', 273) - 273.15,
+            'min': stats.get('mean_2m_air_temperature_min_mean', 273) - 273.15,
+            'max': stats.get('mean_2m_air_temperature_max_mean', 273) - 273.15,
+            'mean': stats.get('mean_2m_air_temperature_mean', 273) - 273.15,
+            'std': stats.get('mean_2m_air_temperature_stdDev', 0),
             'unit': '°C',
-            'time_series': {'dates': dates, 'values': values},
+            'time_series': {
+                'dates': [date for date, _ in series],
+                'values': [value for _, value in series]
+            },
             'total_images': count,
-            'date_range': [start_date, end_date],
-            'region_area_km2': region.area().divide(1e6).getInfo()
+            'date_range': [start_date, end_date]
         }
     
     async def _get_srtm_regional(self, region):
         """Get regional SRTM statistics."""
-        dem = ee.Image('USGS/SRTMGL1_003')
+        dem = self._dem
         
-        stats = dem.reduceRegion(
+        stats = await self._ee_get(dem.reduceRegion(
             reducer=ee.Reducer.minMax().combine(
                 ee.Reducer.mean().combine(ee.Reducer.stdDev(), sharedInputs=True),
                 sharedInputs=True
             ),
             geometry=region,
             scale=90,
-            maxPixels=1e9
-        ).getInfo()
+            maxPixels=1e9,
+            tileScale=_TILE_SCALE_FINE
+        ))
         
         return {
             'min': stats.get('elevation_min', 0),
             'max': stats.get('elevation_max', 0),
             'mean': stats.get('elevation_mean', 0),
             'std': stats.get('elevation_stdDev', 0),
-            'unit': 'meters',
-            'region_area_km2': region.area().divide(1e6).getInfo()
+            'unit': 'meters'
         }
     
     async def _get_sentinel2_regional(self, region, start_date, end_date):
@@ -981,33 +1828,40 @@ class GEEService:
             start_date = start.strftime('%Y-%m-%d')
             end_date = end.strftime('%Y-%m-%d')
         
-        def calculate_ndvi(image):
-            ndvi = image.normalizedDifference(['B8', 'B4']).rename('NDVI')
-            return image.addBands(ndvi)
-        
-        collection = ee.ImageCollection('COPERNICUS/S2_SR') \
+        collection = self._s2 \
             .filterDate(start_date, end_date) \
             .filterBounds(region) \
-            .filter(ee.Filter.lt('CLOUDY_PIXEL_PERCENTAGE', 20)) \
-            .map(calculate_ndvi) \
-            .select('NDVI')
+            .filter(ee.Filter.lt('CLOUDY_PIXEL_PERCENTAGE', 20))
         
-        count = collection.size().getInfo()
+        # NDVI of the median B8/B4 composite, reduced over the bbox itself
+        # together with the count in one request; NDVI is computed once on
+        # the composite rather than mapped over every scene. Scenes are large
+        # at 100 m, so the reduction is kept to the requested area rather
+        # than the shared grid tiles.
+        ndvi = collection \
+            .select(['B8', 'B4']) \
+            .median() \
+            .normalizedDifference(['B8', 'B4']) \
+            .rename('NDVI')
+        size = collection.size()
+        result = await self._ee_get(ee.Dictionary({
+            'count': size,
+            'stats': ee.Algorithms.If(
+                size.gt(0),
+                ndvi.reduceRegion(
+                    reducer=ee.Reducer.mean().combine(ee.Reducer.minMax(), sharedInputs=True),
+                    geometry=region,
+                    scale=100,
+                    maxPixels=1e9,
+                    tileScale=_TILE_SCALE_FINE
+                ),
+                ee.Dictionary()
+            )
+        }))
+        count, stats = result['count'], result['stats']
         if count == 0:
             return {'error': 'No cloud-free images', 'date_range': [start_date, end_date]}
-        
-        # Get mean NDVI
-        mean_ndvi = collection.mean()
-        stats = mean_ndvi.reduceRegion(
-            reducer=ee.Reducer.minMax().combine(
-                ee.Reducer.mean(), sharedInputs=True
-            ),
-            geometry=region,
-            scale=100,
-            maxPixels=1e9
-        ).getInfo()
-        
-        mean_val = stats.get('NDVI_mean', 0)
+        mean_val = stats.get('NDVI_mean') or 0
         
         return {
             'min': stats.get('NDVI_min', -1),
@@ -1016,42 +1870,34 @@ class GEEService:
             'unit': 'index (-1 to 1)',
             'interpretation': self._interpret_ndvi(mean_val),
             'total_images': count,
-            'date_range': [start_date, end_date],
-            'region_area_km2': region.area().divide(1e6).getInfo()
+            'date_range': [start_date, end_date]
         }
     
     async def _get_worldcover_regional(self, region):
         """Get regional WorldCover statistics."""
-        worldcover = ee.ImageCollection('ESA/WorldCover/v100').first()
+        worldcover = self._worldcover
         
-        # Get histogram of land cover classes
-        histogram = worldcover.reduceRegion(
+        # Histogram of land cover classes; only the 'Map' band histogram is
+        # fetched, the bbox area is shared across datasets by the caller
+        histogram = await self._ee_get(ee.Dictionary(worldcover.reduceRegion(
             reducer=ee.Reducer.frequencyHistogram(),
             geometry=region,
             scale=100,
-            maxPixels=1e9
-        ).getInfo()
-        
-        lc_names = {
-            '10': 'Tree cover', '20': 'Shrubland', '30': 'Grassland',
-            '40': 'Cropland', '50': 'Built-up', '60': 'Bare/sparse vegetation',
-            '70': 'Snow and ice', '80': 'Water bodies', '90': 'Herbaceous wetland',
-            '95': 'Mangroves', '100': 'Moss and lichen'
-        }
+            maxPixels=1e9,
+            tileScale=_TILE_SCALE_FINE
+        )).get('Map', ee.Dictionary())) or {}
         
         class_distribution = {}
-        if 'Map' in histogram:
-            for class_val, count in histogram['Map'].items():
-                class_name = lc_names.get(class_val, f'Class {class_val}')
-                class_distribution[class_name] = int(count)
+        for class_val, count in histogram.items():
+            class_name = _LC_REGIONAL_NAMES.get(class_val, f'Class {class_val}')
+            class_distribution[class_name] = int(count)
         
-        # Get dominant class
+        # Get dominant class (at most ~11 entries)
         dominant_class = max(class_distribution, key=class_distribution.get) if class_distribution else 'Unknown'
         
         return {
             'dominant_class': dominant_class,
             'class_distribution': class_distribution,
             'unit': 'pixel count',
-            'year': '2020',
-            'region_area_km2': region.area().divide(1e6).getInfo()
+            'year': '2020'
         }
@@ -3,19 +3,28 @@ AquaPredict Backend API
 Comprehensive backend service with GEE integration, model inference, settings, and export functionality.
 """
 
-from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks, Query
+from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks, Body, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse, StreamingResponse
-from pydantic import BaseModel, Field, validator
-from typing import List, Dict, Any, Optional, Literal
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse, FileResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+from typing import List, Dict, Any, Optional, Literal, Tuple, Union
 import numpy as np
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import json
+import gzip
+import asyncio
+import hashlib
+import time
+import functools
+import orjson
 import os
 from pathlib import Path
 import io
 import csv
+from enum import Enum
+from types import MappingProxyType
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -26,7 +35,7 @@ print(f"Oracle User: {os.getenv('ORACLE_USER')}")
 print(f"Oracle DSN: {os.getenv('ORACLE_DSN')}")
 print(f"Oracle Password set: {'Yes' if os.getenv('ORACLE_PASSWORD') else 'No'}")
 
-from gee_service import GEEService
+from gee_service import GEEService, LocationFeatures
 from model_service import ModelService
 from settings_service import SettingsService
 from export_service import ExportService
@@ -47,13 +56,89 @@ logger = logging.getLogger(__name__)
 logging.getLogger('uvicorn.access').setLevel(logging.WARNING)
 logging.getLogger('uvicorn.error').setLevel(logging.WARNING)
 
+
+# Last formatted response timestamp, as (epoch second, ISO string)
+_utcnow_cache = (0, "")
+
+
+def _utcnow() -> str:
+    """Current UTC time as an ISO 8601 string, formatted at most once per second."""
+    global _utcnow_cache
+    now = int(time.time())
+    if now != _utcnow_cache[0]:
+        _utcnow_cache = (now, datetime.fromtimestamp(now, timezone.utc).isoformat())
+    return _utcnow_cache[1]
+
+
+def _etag(data: bytes) -> str:
+    """Strong ETag for a serialized body."""
+    return f'"{hashlib.md5(data).hexdigest()}"'
+
+
+def _json_bytes_response(
+    request: Request,
+    body: bytes,
+    etag: str,
+    cache_control: Optional[str] = None,
+    gzipped: Optional[bytes] = None
+) -> Response:
+    """
+    Pre-serialized JSON response, or a bodiless 304 if the client has this ETag.
+    
+    Args:
+        request: Incoming request (read for If-None-Match and Accept-Encoding)
+        body: Serialized JSON body
+        etag: ETag identifying the body's content
+        cache_control: Optional Cache-Control header value
+        gzipped: Optional precompressed body, sent to clients accepting gzip
+        
+    Returns:
+        200 JSON response with an ETag header, or 304 Not Modified
+    """
+    headers = {"ETag": etag}
+    if cache_control:
+        headers["Cache-Control"] = cache_control
+    if gzipped is not None:
+        headers["Vary"] = "Accept-Encoding"
+        if "gzip" in request.headers.get("accept-encoding", ""):
+            # Distinct ETag per encoding, as the bytes differ
+            body = gzipped
+            headers["ETag"] = etag = f'{etag[:-1]}-gzip"'
+            headers["Content-Encoding"] = "gzip"
+    
+    if etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _etag_response(request: Request, payload: Any, etag_payload: Any = None) -> Response:
+    """
+    JSON response carrying an ETag, or a bodiless 304 if the client already has it.
+    
+    Args:
+        request: Incoming request (read for If-None-Match)
+        payload: Response body
+        etag_payload: Part of the body that identifies its content; defaults
+            to the whole payload (exclude volatile fields such as timestamps)
+            
+    Returns:
+        200 JSON response with an ETag header, or 304 Not Modified
+    """
+    body = orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+    source = body if etag_payload is None else orjson.dumps(
+        etag_payload, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_SORT_KEYS
+    )
+    return _json_bytes_response(request, body, _etag(source))
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="AquaPredict Backend API",
     description="Comprehensive geospatial AI platform for aquifer prediction and groundwater management",
     version="2.0.0",
     docs_url="/api/docs",
-    redoc_url="/api/redoc"
+    redoc_url="/api/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -65,6 +150,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger responses; bodies that are already encoded pass through
+app.add_middleware(GZipMiddleware, minimum_size=512)
+
 # Include routers
 app.include_router(inference.router)
 app.include_router(oracle.router)
@@ -82,14 +170,29 @@ simulated_data = SimulatedDataProvider()
 # REQUEST/RESPONSE MODELS
 # ============================================================================
 
+class RegionName(str, Enum):
+    """Predefined preview regions, or a custom bounding box."""
+    kenya = "kenya"
+    nairobi = "nairobi"
+    mombasa = "mombasa"
+    mt_kenya = "mt_kenya"
+    turkana = "turkana"
+    custom = "custom"
+
+
 class Location(BaseModel):
     """Geographic location."""
     lat: float = Field(..., ge=-90, le=90, description="Latitude")
     lon: float = Field(..., ge=-180, le=180, description="Longitude")
 
-    @validator('lat', 'lon')
-    def round_coordinates(cls, v):
-        return round(v, 6)
+    # Frozen so locations are hashable and can key memoization caches
+    model_config = ConfigDict(frozen=True)
+
+    @model_validator(mode='after')
+    def round_coordinates(self):
+        object.__setattr__(self, 'lat', round(self.lat, 6))
+        object.__setattr__(self, 'lon', round(self.lon, 6))
+        return self
 
 
 class PredictionRequest(BaseModel):
@@ -109,7 +212,7 @@ class PredictionResponse(BaseModel):
     geological_formation: str
     estimated_porosity: str
     recommended_drilling_depth: str
-    data_source: Literal["gee", "simulated"]
+    data_source: Literal["gee", "simulated", "provided"]
     timestamp: str
     features_used: Dict[str, float]
 
@@ -119,12 +222,15 @@ class ForecastRequest(BaseModel):
     location: Location
     horizon: int = Field(12, ge=1, le=36, description="Forecast horizon in months")
     use_real_data: bool = Field(True, description="Use real GEE data if available")
+    layout: Literal["rows", "columns"] = Field(
+        "rows", description="Monthly forecast as one record per month, or one list per quantity"
+    )
 
 
 class ForecastResponse(BaseModel):
     """Response for recharge forecast."""
     location: Location
-    forecast: List[Dict[str, Any]]
+    forecast: Union[List[Dict[str, Any]], Dict[str, List[Any]]]
     summary: Dict[str, Any]
     data_source: Literal["gee", "simulated"]
     timestamp: str
@@ -161,6 +267,13 @@ class ExportRequest(BaseModel):
     include_metadata: bool = True
 
 
+class PreviewBatchRequest(BaseModel):
+    """Preview request for several datasets over the same region and dates."""
+    dataset_ids: List[str] = Field(..., min_length=1, max_length=20)
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
+
+
 # ============================================================================
 # HEALTH & STATUS ENDPOINTS
 # ============================================================================
@@ -200,7 +313,7 @@ async def health_check():
     
     return {
         "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": _utcnow(),
         "infrastructure": "Oracle Cloud Infrastructure",
         "services": {
             "oracle_atp": oracle_service.is_available(),
@@ -285,7 +398,7 @@ async def predict_aquifer(request: PredictionRequest):
             data_source = "simulated"
         
         # Make prediction
-        prediction_result = model_service.predict_aquifer(features)
+        prediction_result = await model_service.predict_aquifer_async(features)
         
         return PredictionResponse(
             location=request.location,
@@ -297,8 +410,8 @@ async def predict_aquifer(request: PredictionRequest):
             estimated_porosity=prediction_result["estimated_porosity"],
             recommended_drilling_depth=prediction_result["recommended_drilling_depth"],
             data_source=data_source,
-            timestamp=datetime.utcnow().isoformat(),
-            features_used=features
+            timestamp=_utcnow(),
+            features_used=features.to_dict() if isinstance(features, LocationFeatures) else features
         )
     
     except Exception as e:
@@ -306,6 +419,76 @@ async def predict_aquifer(request: PredictionRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Largest number of locations accepted in one batch prediction request
+_MAX_PREDICTION_BATCH = 500
+
+
+@app.post("/api/v1/predict/aquifer/batch", response_model=List[PredictionResponse])
+async def predict_aquifer_batch(
+    batch: List[PredictionRequest] = Body(..., min_length=1, max_length=_MAX_PREDICTION_BATCH)
+):
+    """
+    Predict aquifer presence for many locations in one call.
+    GEE features for all locations are fetched in a single bulk request and
+    the model is evaluated once over the stacked feature matrix.
+    """
+    try:
+        logger.info(f"Batch aquifer prediction request: {len(batch)} locations")
+        
+        features_list: List[Any] = [None] * len(batch)
+        sources: List[str] = [None] * len(batch)
+        gee_indices = []
+        
+        for i, req in enumerate(batch):
+            if req.features:
+                features_list[i] = req.features
+                sources[i] = "provided"
+            elif req.use_real_data and gee_service.is_available():
+                gee_indices.append(i)
+            else:
+                features_list[i] = simulated_data.generate_features(req.location.lat, req.location.lon)
+                sources[i] = "simulated"
+        
+        if gee_indices:
+            points = np.array([
+                [batch[i].location.lat, batch[i].location.lon] for i in gee_indices
+            ])
+            try:
+                bulk = await gee_service.get_features_bulk(points)
+                source = "gee"
+            except Exception as e:
+                logger.warning(f"GEE bulk fetch failed, using simulated: {e}")
+                bulk = [simulated_data.generate_features(lat, lon) for lat, lon in points]
+                source = "simulated"
+            for i, features in zip(gee_indices, bulk):
+                features_list[i] = features
+                sources[i] = source
+        
+        results = model_service.predict_aquifer_batch(features_list)
+        timestamp = _utcnow()
+        
+        return [
+            PredictionResponse(
+                location=req.location,
+                prediction=result["prediction"],
+                probability=result["probability"],
+                confidence_interval=result["confidence_interval"],
+                depth_bands=result["depth_bands"],
+                geological_formation=result["geological_formation"],
+                estimated_porosity=result["estimated_porosity"],
+                recommended_drilling_depth=result["recommended_drilling_depth"],
+                data_source=source,
+                timestamp=timestamp,
+                features_used=features.to_dict() if isinstance(features, LocationFeatures) else features
+            )
+            for req, result, features, source in zip(batch, results, features_list, sources)
+        ]
+    
+    except Exception as e:
+        logger.error(f"Batch prediction error: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @app.post("/api/v1/predict/recharge", response_model=ForecastResponse)
 async def forecast_recharge(request: ForecastRequest):
     """
@@ -343,7 +526,8 @@ async def forecast_recharge(request: ForecastRequest):
         # Make forecast
         forecast_result = model_service.forecast_recharge(
             climate_data,
-            horizon=request.horizon
+            horizon=request.horizon,
+            columnar=request.layout == "columns"
         )
         
         return ForecastResponse(
@@ -351,7 +535,7 @@ async def forecast_recharge(request: ForecastRequest):
             forecast=forecast_result["forecast"],
             summary=forecast_result["summary"],
             data_source=data_source,
-            timestamp=datetime.utcnow().isoformat()
+            timestamp=_utcnow()
         )
     
     except Exception as e:
@@ -387,7 +571,7 @@ async def get_extraction_recommendations(request: ExtractionRecommendationReques
         return {
             "location": request.location.dict(),
             **recommendations,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": _utcnow()
         }
     
     except Exception as e:
@@ -400,9 +584,10 @@ async def get_extraction_recommendations(request: ExtractionRecommendationReques
 # ============================================================================
 
 @app.get("/api/v1/settings")
-async def get_settings():
+async def get_settings(request: Request):
     """Get current user settings."""
-    return settings_service.get_settings()
+    body = settings_service.get_settings_json()
+    return _json_bytes_response(request, body, _etag(body))
 
 
 @app.put("/api/v1/settings")
@@ -413,7 +598,7 @@ async def update_settings(settings: SettingsUpdate):
         return {
             "status": "success",
             "settings": updated,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": _utcnow()
         }
     except Exception as e:
         logger.error(f"Settings update error: {e}", exc_info=True)
@@ -440,32 +625,37 @@ async def export_data(request: ExportRequest):
     """Export data in various formats."""
     try:
         logger.info(f"Export request: {request.export_type} as {request.format}")
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         
         if request.format == "csv":
-            content = export_service.export_csv(request.data, request.export_type)
+            content = export_service.export_csv_iter(request.data, request.export_type)
             media_type = "text/csv"
-            filename = f"aquapredict_{request.export_type}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+            extension = "csv"
         
         elif request.format == "json":
-            content = export_service.export_json(request.data, request.include_metadata)
+            content = export_service.export_json_bytes(request.data, request.include_metadata)
             media_type = "application/json"
-            filename = f"aquapredict_{request.export_type}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            extension = "json"
         
         elif request.format == "geojson":
-            content = export_service.export_geojson(request.data)
+            content = export_service.export_geojson_bytes(request.data)
             media_type = "application/geo+json"
-            filename = f"aquapredict_{request.export_type}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.geojson"
+            extension = "geojson"
         
         elif request.format == "pdf":
             content = export_service.export_pdf(request.data, request.export_type)
             media_type = "application/pdf"
-            filename = f"aquapredict_{request.export_type}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+            extension = "pdf"
         
         else:
             raise HTTPException(status_code=400, detail=f"Unsupported format: {request.format}")
         
+        filename = f"aquapredict_{request.export_type}_{timestamp}.{extension}"
+        
+        # CSV is a generator streamed as rows are produced; JSON, GeoJSON and
+        # PDF arrive as ready-encoded bytes
         return StreamingResponse(
-            io.BytesIO(content.encode() if isinstance(content, str) else content),
+            io.BytesIO(content) if isinstance(content, bytes) else content,
             media_type=media_type,
             headers={"Content-Disposition": f"attachment; filename={filename}"}
         )
@@ -503,15 +693,16 @@ async def reload_models():
 @app.post("/api/v1/models/upload")
 async def upload_model(
     model_type: str = Query(..., description="Model type: aquifer or recharge"),
+    model_format: str = Query("pkl", description="Model format: pkl, or onnx/ubj (aquifer only)"),
     model_file: bytes = None
 ):
     """Upload a new model (e.g., from Colab training)."""
     try:
-        model_service.save_model(model_type, model_file)
+        model_service.save_model(model_type, model_file, model_format)
         return {
             "status": "success",
             "message": f"{model_type} model uploaded successfully",
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": _utcnow()
         }
     except Exception as e:
         logger.error(f"Model upload error: {e}", exc_info=True)
@@ -522,132 +713,287 @@ async def upload_model(
 # DATA SOURCE ENDPOINTS
 # ============================================================================
 
-@app.get("/api/v1/data/sources")
-async def get_data_sources():
-    """Get status of all data sources with preview configurations."""
-    return {
-        "gee": {
-            "available": gee_service.is_available(),
-            "datasets": [
-                {
-                    "id": "chirps",
-                    "name": "CHIRPS - Precipitation",
-                    "collection": "UCSB-CHG/CHIRPS/DAILY",
-                    "description": "Climate Hazards Group InfraRed Precipitation with Station data",
-                    "band": "precipitation",
-                    "unit": "mm/day",
-                    "temporal_resolution": "Daily",
-                    "spatial_resolution": "5km",
-                    "visualization": {
-                        "min": 1,
-                        "max": 17,
-                        "palette": ["001137", "0aab1e", "e7eb05", "ff4a2d", "e90000"]
-                    },
-                    "default_center": {"lat": 7.71, "lon": 17.93, "zoom": 2}
-                },
-                {
-                    "id": "era5",
-                    "name": "ERA5 - Temperature",
-                    "collection": "ECMWF/ERA5/MONTHLY",
-                    "description": "ECMWF Reanalysis v5 - Temperature data",
-                    "band": "mean_2m_air_temperature",
-                    "unit": "Kelvin",
-                    "temporal_resolution": "Monthly",
-                    "spatial_resolution": "27.8km",
-                    "visualization": {
-                        "min": 250,
-                        "max": 320,
-                        "palette": ["000080", "0000ff", "00ffff", "ffff00", "ff0000", "800000"]
-                    },
-                    "default_center": {"lat": 0.0, "lon": 37.9, "zoom": 5}
-                },
-                {
-                    "id": "srtm",
-                    "name": "SRTM - Elevation",
-                    "collection": "USGS/SRTMGL1_003",
-                    "description": "Shuttle Radar Topography Mission - Digital Elevation Model",
-                    "band": "elevation",
-                    "unit": "meters",
-                    "temporal_resolution": "Static",
-                    "spatial_resolution": "30m",
-                    "visualization": {
-                        "min": 0,
-                        "max": 3000,
-                        "palette": ["006633", "E5FFCC", "662A00", "D8D8D8", "F5F5F5"]
-                    },
-                    "default_center": {"lat": 0.0236, "lon": 37.9062, "zoom": 6}
-                },
-                {
-                    "id": "sentinel2",
-                    "name": "Sentinel-2 - NDVI",
-                    "collection": "COPERNICUS/S2_SR",
-                    "description": "Sentinel-2 Surface Reflectance - Vegetation Index",
-                    "band": "NDVI",
-                    "unit": "index",
-                    "temporal_resolution": "5 days",
-                    "spatial_resolution": "10m",
-                    "visualization": {
-                        "min": -1,
-                        "max": 1,
-                        "palette": ["brown", "yellow", "green", "darkgreen"]
-                    },
-                    "default_center": {"lat": 0.0236, "lon": 37.9062, "zoom": 8}
-                },
-                {
-                    "id": "worldcover",
-                    "name": "ESA WorldCover - Land Cover",
-                    "collection": "ESA/WorldCover/v100",
-                    "description": "ESA WorldCover 10m Land Cover Classification",
-                    "band": "Map",
-                    "unit": "class",
-                    "temporal_resolution": "Annual",
-                    "spatial_resolution": "10m",
-                    "visualization": {
-                        "min": 10,
-                        "max": 100,
-                        "palette": ["006400", "ffbb22", "ffff4c", "f096ff", "fa0000", "b4b4b4", "f0f0f0", "0064c8", "0096a0", "00cf75", "fae6a0"]
-                    },
-                    "default_center": {"lat": 0.0236, "lon": 37.9062, "zoom": 8}
-                }
-            ]
+# Preview configurations of the GEE datasets; static, so built once as
+# read-only views that concurrent requests can share without copying
+_DATASETS = tuple(MappingProxyType(dataset) for dataset in (
+    {
+        "id": "chirps",
+        "name": "CHIRPS - Precipitation",
+        "collection": "UCSB-CHG/CHIRPS/DAILY",
+        "description": "Climate Hazards Group InfraRed Precipitation with Station data",
+        "band": "precipitation",
+        "unit": "mm/day",
+        "temporal_resolution": "Daily",
+        "spatial_resolution": "5km",
+        "visualization": {
+            "min": 1,
+            "max": 17,
+            "palette": ["001137", "0aab1e", "e7eb05", "ff4a2d", "e90000"]
+        },
+        "default_center": {"lat": 7.71, "lon": 17.93, "zoom": 2}
+    },
+    {
+        "id": "era5",
+        "name": "ERA5 - Temperature",
+        "collection": "ECMWF/ERA5/MONTHLY",
+        "description": "ECMWF Reanalysis v5 - Temperature data",
+        "band": "mean_2m_air_temperature",
+        "unit": "Kelvin",
+        "temporal_resolution": "Monthly",
+        "spatial_resolution": "27.8km",
+        "visualization": {
+            "min": 250,
+            "max": 320,
+            "palette": ["000080", "0000ff", "00ffff", "ffff00", "ff0000", "800000"]
+        },
+        "default_center": {"lat": 0.0, "lon": 37.9, "zoom": 5}
+    },
+    {
+        "id": "srtm",
+        "name": "SRTM - Elevation",
+        "collection": "USGS/SRTMGL1_003",
+        "description": "Shuttle Radar Topography Mission - Digital Elevation Model",
+        "band": "elevation",
+        "unit": "meters",
+        "temporal_resolution": "Static",
+        "spatial_resolution": "30m",
+        "visualization": {
+            "min": 0,
+            "max": 3000,
+            "palette": ["006633", "E5FFCC", "662A00", "D8D8D8", "F5F5F5"]
+        },
+        "default_center": {"lat": 0.0236, "lon": 37.9062, "zoom": 6}
+    },
+    {
+        "id": "sentinel2",
+        "name": "Sentinel-2 - NDVI",
+        "collection": "COPERNICUS/S2_SR",
+        "description": "Sentinel-2 Surface Reflectance - Vegetation Index",
+        "band": "NDVI",
+        "unit": "index",
+        "temporal_resolution": "5 days",
+        "spatial_resolution": "10m",
+        "visualization": {
+            "min": -1,
+            "max": 1,
+            "palette": ["brown", "yellow", "green", "darkgreen"]
         },
-        "simulated": {
-            "available": True,
-            "description": "Fallback simulated data based on hydrogeological principles"
+        "default_center": {"lat": 0.0236, "lon": 37.9062, "zoom": 8}
+    },
+    {
+        "id": "worldcover",
+        "name": "ESA WorldCover - Land Cover",
+        "collection": "ESA/WorldCover/v100",
+        "description": "ESA WorldCover 10m Land Cover Classification",
+        "band": "Map",
+        "unit": "class",
+        "temporal_resolution": "Annual",
+        "spatial_resolution": "10m",
+        "visualization": {
+            "min": 10,
+            "max": 100,
+            "palette": ["006400", "ffbb22", "ffff4c", "f096ff", "fa0000", "b4b4b4", "f0f0f0", "0064c8", "0096a0", "00cf75", "fae6a0"]
         },
+        "default_center": {"lat": 0.0236, "lon": 37.9062, "zoom": 8}
+    }
+))
+
+_SIMULATED_SOURCE = MappingProxyType({
+    "available": True,
+    "description": "Fallback simulated data based on hydrogeological principles"
+})
+
+
+@functools.lru_cache(maxsize=8)
+def _data_sources_body(gee_available: bool, models_loaded: bool, model_count: int) -> Tuple[bytes, bytes, str]:
+    """
+    Serialized data sources payload, gzipped copy and ETag.
+    
+    Only the live status fields vary, so each variant is serialized and
+    compressed once rather than per request.
+    """
+    body = orjson.dumps({
+        "gee": {
+            "available": gee_available,
+            "datasets": _DATASETS
+        },
+        "simulated": _SIMULATED_SOURCE,
         "models": {
-            "loaded": model_service.models_loaded,
-            "count": len(model_service.get_model_info())
+            "loaded": models_loaded,
+            "count": model_count
         }
-    }
+    }, default=dict)
+    return body, gzip.compress(body, compresslevel=6), _etag(body)
+
+
+_FEATURES_BODY = orjson.dumps({
+    "features": [
+        {"name": "elevation", "unit": "meters", "source": "SRTM"},
+        {"name": "slope", "unit": "degrees", "source": "Derived from SRTM"},
+        {"name": "twi", "unit": "index", "source": "Calculated"},
+        {"name": "precip_mean", "unit": "mm/year", "source": "CHIRPS"},
+        {"name": "temp_mean", "unit": "°C", "source": "ERA5"},
+        {"name": "ndvi", "unit": "index", "source": "Sentinel-2"},
+        {"name": "landcover", "unit": "class", "source": "ESA WorldCover"}
+    ]
+})
+_FEATURES_ETAG = _etag(_FEATURES_BODY)
+
+# Gzipped features payload, written at startup and served straight from disk
+_STATIC_DIR = Path(__file__).parent / 'static'
+_FEATURES_GZ_PATH = _STATIC_DIR / 'features.json.gz'
+_FEATURES_GZ_ETAG = f'{_FEATURES_ETAG[:-1]}-gzip"'
+
+
+def _write_static_gzip(path: Path, body: bytes):
+    """Atomically write a gzipped copy of a static response body."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(gzip.compress(body, compresslevel=9, mtime=0))
+    os.replace(tmp_path, path)
+
+
+@app.get("/api/v1/data/sources")
+async def get_data_sources(request: Request):
+    """Get status of all data sources with preview configurations."""
+    body, gzipped, etag = _data_sources_body(
+        gee_service.is_available(),
+        model_service.models_loaded,
+        model_service.model_count
+    )
+    # Live status fields can change at any time, so clients always revalidate
+    return _json_bytes_response(request, body, etag, cache_control="no-cache", gzipped=gzipped)
 
 
 @app.get("/api/v1/data/features")
-async def get_feature_info():
+async def get_feature_info(request: Request):
     """Get information about available features."""
-    return {
-        "features": [
-            {"name": "elevation", "unit": "meters", "source": "SRTM"},
-            {"name": "slope", "unit": "degrees", "source": "Derived from SRTM"},
-            {"name": "twi", "unit": "index", "source": "Calculated"},
-            {"name": "precip_mean", "unit": "mm/year", "source": "CHIRPS"},
-            {"name": "temp_mean", "unit": "°C", "source": "ERA5"},
-            {"name": "ndvi", "unit": "index", "source": "Sentinel-2"},
-            {"name": "landcover", "unit": "class", "source": "ESA WorldCover"}
-        ]
-    }
+    cache_control = "public, max-age=300"
+    if "gzip" in request.headers.get("accept-encoding", "") and _FEATURES_GZ_PATH.is_file():
+        headers = {
+            "ETag": _FEATURES_GZ_ETAG,
+            "Cache-Control": cache_control,
+            "Vary": "Accept-Encoding"
+        }
+        if _FEATURES_GZ_ETAG in request.headers.get("if-none-match", ""):
+            return Response(status_code=304, headers=headers)
+        return FileResponse(
+            _FEATURES_GZ_PATH,
+            media_type="application/json",
+            headers={**headers, "Content-Encoding": "gzip"}
+        )
+    
+    return _json_bytes_response(
+        request, _FEATURES_BODY, _FEATURES_ETAG, cache_control=cache_control
+    )
+
+
+# Extra time a preview waits for its tile URL once the statistics are ready;
+# a request cut short still finishes and caches the URL for the next one
+_PREVIEW_TILE_GRACE_S = 2.0
+
+# Bounding boxes of the predefined preview regions: [west, south, east, north]
+_REGION_BBOX = MappingProxyType({
+    RegionName.kenya: (33.9, -4.7, 41.9, 5.5),
+    RegionName.nairobi: (36.6, -1.5, 37.1, -1.1),
+    RegionName.mombasa: (39.5, -4.2, 39.8, -3.9),
+    RegionName.mt_kenya: (37.0, -0.5, 37.5, 0.0),
+    RegionName.turkana: (35.0, 2.5, 36.5, 4.5)
+})
+
+
+class RegionBounds(BaseModel):
+    """A resolved preview region."""
+    region: RegionName
+    bbox: List[float]
+
+
+def _region_bounds(
+    region: RegionName = Query(RegionName.kenya, description="Predefined region or 'custom'"),
+    west: Optional[float] = Query(None, ge=-180, le=180, description="West longitude for custom region"),
+    south: Optional[float] = Query(None, ge=-90, le=90, description="South latitude for custom region"),
+    east: Optional[float] = Query(None, ge=-180, le=180, description="East longitude for custom region"),
+    north: Optional[float] = Query(None, ge=-90, le=90, description="North latitude for custom region")
+) -> RegionBounds:
+    """Resolve the region query parameters to a validated [west, south, east, north] bbox."""
+    if region is not RegionName.custom:
+        return RegionBounds(region=region, bbox=list(_REGION_BBOX[region]))
+    
+    if None in (west, south, east, north):
+        raise HTTPException(status_code=422, detail="A custom region requires west, south, east and north")
+    if west >= east or south >= north:
+        raise HTTPException(status_code=422, detail="Custom region must satisfy west < east and south < north")
+    return RegionBounds(region=region, bbox=[west, south, east, north])
+
+
+@app.post("/api/v1/data/preview/batch")
+async def get_dataset_preview_batch(
+    request: Request,
+    batch: PreviewBatchRequest,
+    bounds: RegionBounds = Depends(_region_bounds)
+):
+    """
+    Get previews for several datasets in one request.
+    
+    Statistics and tile URLs for all datasets are fetched concurrently; Earth
+    Engine calls are still bounded by the service's concurrency limit and
+    served from the same caches as single previews.
+    
+    Args:
+        batch: Dataset IDs and date range
+        bounds: Region and bbox, resolved from the region query parameter
+            (and west, south, east, north for a custom region)
+    """
+    try:
+        if not gee_service.is_available():
+            raise HTTPException(
+                status_code=503,
+                detail="Google Earth Engine not available. Please configure GEE credentials."
+            )
+        
+        region, bbox = bounds.region.value, bounds.bbox
+        dataset_ids = list(dict.fromkeys(batch.dataset_ids))
+        start_date, end_date = batch.start_date, batch.end_date
+        
+        tile_task = asyncio.gather(
+            *(gee_service.get_tile_url(d, start_date, end_date) for d in dataset_ids),
+            return_exceptions=True
+        )
+        summary = await gee_service.get_regional_summary(bbox, start_date, end_date, dataset_ids)
+        tile_urls = await tile_task
+        
+        previews = {}
+        for dataset_id, tile_url in zip(dataset_ids, tile_urls):
+            if isinstance(tile_url, Exception):
+                logger.warning(f"Could not generate tile URL for {dataset_id}: {tile_url!r}")
+                tile_url = None
+            stats = summary[dataset_id]
+            date_range = stats.get('date_range') or [start_date, end_date]
+            previews[dataset_id] = {
+                "dataset_id": dataset_id,
+                "tile_url": tile_url,
+                "statistics": stats,
+                "start_date": date_range[0],
+                "end_date": date_range[1]
+            }
+        
+        batch_preview = {"region": region, "bbox": bbox, "previews": previews}
+        return _etag_response(request, {**batch_preview, "timestamp": _utcnow()}, batch_preview)
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Batch dataset preview error: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/api/v1/data/preview/{dataset_id}")
 async def get_dataset_preview(
+    request: Request,
     dataset_id: str,
     start_date: Optional[str] = Query(None, description="Start date (YYYY-MM-DD)"),
     end_date: Optional[str] = Query(None, description="End date (YYYY-MM-DD)"),
-    region: Optional[str] = Query("kenya", description="Region: kenya, nairobi, mombasa, custom"),
-    west: Optional[float] = Query(None, description="West longitude for custom region"),
-    south: Optional[float] = Query(None, description="South latitude for custom region"),
-    east: Optional[float] = Query(None, description="East longitude for custom region"),
-    north: Optional[float] = Query(None, description="North latitude for custom region")
+    bounds: RegionBounds = Depends(_region_bounds)
 ):
     """
     Get detailed dataset preview with regional statistics over a date range.
@@ -656,8 +1002,8 @@ async def get_dataset_preview(
         dataset_id: Dataset identifier (chirps, era5, srtm, etc.)
         start_date: Start date for temporal datasets
         end_date: End date for temporal datasets
-        region: Predefined region or 'custom'
-        west, south, east, north: Bounding box for custom region
+        bounds: Region and bbox, resolved from the region query parameter
+            (and west, south, east, north for a custom region)
     """
     try:
         if not gee_service.is_available():
@@ -666,40 +1012,40 @@ async def get_dataset_preview(
                 detail="Google Earth Engine not available. Please configure GEE credentials."
             )
         
-        # Define region bounds
-        regions = {
-            'kenya': [33.9, -4.7, 41.9, 5.5],
-            'nairobi': [36.6, -1.5, 37.1, -1.1],
-            'mombasa': [39.5, -4.2, 39.8, -3.9],
-            'mt_kenya': [37.0, -0.5, 37.5, 0.0],
-            'turkana': [35.0, 2.5, 36.5, 4.5]
-        }
+        region, bbox = bounds.region.value, bounds.bbox
         
-        if region == 'custom' and all([west, south, east, north]):
-            bbox = [west, south, east, north]
-        else:
-            bbox = regions.get(region, regions['kenya'])
+        # The tile URL is independent of the statistics, so request it first
+        # and let both Earth Engine round-trips run together
+        tile_task = asyncio.ensure_future(gee_service.get_tile_url(dataset_id, start_date, end_date))
         
         # Get regional statistics over date range
-        stats = await gee_service.get_regional_stats(dataset_id, bbox, start_date, end_date)
+        try:
+            stats = await gee_service.get_regional_stats(dataset_id, bbox, start_date, end_date)
+        except Exception:
+            tile_task.cancel()
+            raise
         
-        # Try to get tile URL for visualization (optional)
+        # Try to get tile URL for visualization (optional); it has had the
+        # statistics' run time already, so only wait briefly beyond that
         tile_url = None
         try:
-            tile_url = await gee_service.get_tile_url(dataset_id, start_date, end_date)
+            tile_url = await asyncio.wait_for(tile_task, timeout=_PREVIEW_TILE_GRACE_S)
         except Exception as tile_error:
-            logger.warning(f"Could not generate tile URL: {tile_error}")
+            logger.warning(f"Could not generate tile URL: {tile_error!r}")
         
-        return {
+        preview = {
             "dataset_id": dataset_id,
             "tile_url": tile_url,
             "region": region,
             "bbox": bbox,
             "statistics": stats,
             "start_date": stats.get('date_range', [start_date, end_date])[0] if stats.get('date_range') else start_date,
-            "end_date": stats.get('date_range', [start_date, end_date])[1] if stats.get('date_range') else end_date,
-            "timestamp": datetime.utcnow().isoformat()
+            "end_date": stats.get('date_range', [start_date, end_date])[1] if stats.get('date_range') else end_date
         }
+        
+        # The ETag covers everything but the response timestamp, so repeat
+        # requests for unchanged statistics get a 304
+        return _etag_response(request, {**preview, "timestamp": _utcnow()}, preview)
     
     except Exception as e:
         logger.error(f"Dataset preview error: {e}", exc_info=True)
@@ -724,6 +1070,12 @@ async def startup_event():
     except Exception as e:
         logger.warning("GEE unavailable - using simulated data")
     
+    # Pre-bake the static features payload for zero-copy file responses
+    try:
+        _write_static_gzip(_FEATURES_GZ_PATH, _FEATURES_BODY)
+    except OSError as e:
+        logger.warning(f"Could not write {_FEATURES_GZ_PATH}: {e}")
+    
     logger.info("=" * 60)
     logger.info("AquaPredict API ready")
     logger.info("=" * 60)
@@ -733,6 +1085,8 @@ async def startup_event():
 async def shutdown_event():
     """Cleanup on shutdown."""
     logger.info("Shutting down AquaPredict Backend API...")
+    settings_service.flush()
+    await gee_service.close()
 
 
 if __name__ == "__main__":
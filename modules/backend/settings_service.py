@@ -3,13 +3,23 @@ Settings Service
 Manages user settings and preferences.
 """
 
-import json
+import copy
+import orjson
 import logging
+import os
+import threading
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Delay before pending settings changes are written, so bursts of updates
+# produce a single write
+_SAVE_DEBOUNCE_S = 0.25
+
+# Parsed settings files shared across instances, as {path: (st_mtime_ns, settings)}
+_SETTINGS_CACHE: Dict[Path, Tuple[int, Dict[str, Any]]] = {}
+
 
 class SettingsService:
     """Service for managing user settings."""
@@ -59,35 +69,97 @@ class SettingsService:
             }
         }
         
+        self._save_lock = threading.Lock()
+        self._save_timer: Optional[threading.Timer] = None
+        # Settings serialized at the last change and not yet written to file
+        self._pending_json: Optional[bytes] = None
+        
         self.settings = self._load_settings()
+        
+        # Serialized settings, rebuilt on the first read after a change
+        self._settings_json: Optional[bytes] = None
     
     def _load_settings(self) -> Dict[str, Any]:
         """Load settings from file or create default."""
         if self.settings_file.exists():
             try:
-                with open(self.settings_file, 'r') as f:
-                    settings = json.load(f)
+                cache_key = self.settings_file.resolve()
+                mtime_ns = self.settings_file.stat().st_mtime_ns
+                cached = _SETTINGS_CACHE.get(cache_key)
+                if cached is not None and cached[0] == mtime_ns:
+                    return copy.deepcopy(cached[1])
+                
+                settings = orjson.loads(self.settings_file.read_bytes())
+                _SETTINGS_CACHE[cache_key] = (mtime_ns, copy.deepcopy(settings))
                 logger.info("Loaded settings from file")
                 return settings
             except Exception as e:
                 logger.error(f"Error loading settings: {e}")
-                return self.default_settings.copy()
+                return copy.deepcopy(self.default_settings)
         else:
             self._save_settings(self.default_settings)
-            return self.default_settings.copy()
+            return copy.deepcopy(self.default_settings)
     
     def _save_settings(self, settings: Dict[str, Any]):
-        """Save settings to file."""
+        """Save settings to file, atomically replacing the previous version."""
         try:
-            with open(self.settings_file, 'w') as f:
-                json.dump(settings, f, indent=2)
+            data = orjson.dumps(settings)
+        except Exception as e:
+            logger.error(f"Error saving settings: {e}")
+            return
+        self._write_settings(data)
+    
+    def _write_settings(self, data: bytes):
+        """Write serialized settings to file, atomically replacing the previous version."""
+        tmp_file = self.settings_file.with_name(f"{self.settings_file.name}.{os.getpid()}.tmp")
+        try:
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, data)
+            finally:
+                os.close(fd)
+            os.replace(tmp_file, self.settings_file)
+            
+            _SETTINGS_CACHE[self.settings_file.resolve()] = (
+                self.settings_file.stat().st_mtime_ns, orjson.loads(data)
+            )
             logger.info("Settings saved to file")
         except Exception as e:
             logger.error(f"Error saving settings: {e}")
     
+    def _schedule_save(self):
+        """Snapshot the changed settings and write them once updates settle."""
+        # Serialize on the caller's thread so the timer never reads
+        # self.settings while it is being mutated
+        settings_json = self._settings_json = orjson.dumps(self.settings)
+        with self._save_lock:
+            self._pending_json = settings_json
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(_SAVE_DEBOUNCE_S, self.flush)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+    
+    def flush(self):
+        """Write pending settings changes to file immediately."""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            settings_json, self._pending_json = self._pending_json, None
+            if settings_json is None:
+                return
+            self._write_settings(settings_json)
+    
     def get_settings(self) -> Dict[str, Any]:
-        """Get current settings."""
-        return self.settings.copy()
+        """Get an independent copy of the current settings."""
+        return orjson.loads(self.get_settings_json())
+    
+    def get_settings_json(self) -> bytes:
+        """Get the current settings serialized as JSON, reused until they change."""
+        settings_json = self._settings_json
+        if settings_json is None:
+            settings_json = self._settings_json = orjson.dumps(self.settings)
+        return settings_json
     
     def update_settings(self, updates: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -113,13 +185,13 @@ class SettingsService:
                         category[key] = value
                         break
         
-        self._save_settings(self.settings)
-        return self.settings.copy()
+        self._schedule_save()
+        return self.get_settings()
     
     def reset_to_defaults(self):
         """Reset all settings to defaults."""
-        self.settings = self.default_settings.copy()
-        self._save_settings(self.settings)
+        self.settings = copy.deepcopy(self.default_settings)
+        self._schedule_save()
         logger.info("Settings reset to defaults")
     
     def get_setting(self, category: str, key: str) -> Any:
@@ -148,4 +220,4 @@ class SettingsService:
             self.settings[category] = {}
         
         self.settings[category][key] = value
-        self._save_settings(self.settings)
+        self._schedule_save()
@@ -5,11 +5,69 @@ Provides realistic fallback data when GEE is unavailable.
 
 import numpy as np
 import logging
-from typing import Dict, List
-from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Kenya bimodal rainfall pattern, indexed by month number (1-12)
+_SEASONAL_PRECIP = np.array([
+    np.nan,
+    0.4, 0.5, 1.8, 2.2, 1.5,  # Long rains
+    0.6, 0.5, 0.5, 0.6,
+    1.4, 1.8, 1.2  # Short rains
+])
+
+
+# Region names, indexed by region code
+_REGIONS = ('western', 'central', 'eastern', 'coastal', 'northern')
+
+# Elevation range per region code (m): Kenya 0-5199m, higher in
+# central/western, lower in coastal/northern
+_ELEVATION_LOW = np.array([1000, 1200, 500, 0, 300])
+_ELEVATION_SPAN = np.array([2000, 2500, 1500, 500, 1000]) - _ELEVATION_LOW
+
+# Slope range (degrees) for lowland (<=1500m) and highland locations
+_SLOPE_LOW = np.array([0.0, 5.0])
+_SLOPE_SPAN = np.array([10.0, 20.0])
+
+# NDVI range for dry (<=800mm), moderate and wet (>1200mm) locations
+_NDVI_LOW = np.array([0.2, 0.4, 0.6])
+_NDVI_SPAN = np.array([0.3, 0.3, 0.25])
+
+# Landcover draws per NDVI group (<=0.4, <=0.7, >0.7): cumulative
+# probabilities and the ESA WorldCover classes they select
+_LANDCOVER_CUM_P = np.array([
+    [0.6, 1.0, 1.0],
+    [0.3, 0.7, 1.0],
+    [0.5, 0.8, 1.0]
+])
+_LANDCOVER_CLASSES = np.array([
+    [30, 60, 60],
+    [20, 30, 40],
+    [10, 40, 90]
+])
+
+
+def _region_codes(lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """Index into _REGIONS of the Kenya region each location falls in."""
+    # Simplified regional classification
+    return np.select(
+        [
+            lons < 35.5,
+            lons > 39.5,
+            lats > 0.5,
+            (lons >= 36.5) & (lons <= 37.5) & (lats >= -1.5) & (lats <= 0.5)
+        ],
+        [0, 3, 4, 1],
+        default=2
+    )
+
+
+def _location_rng(lat: float, lon: float) -> np.random.Generator:
+    """Random generator seeded from a location, so each point is reproducible."""
+    return np.random.default_rng(hash((round(lat, 3), round(lon, 3))) & 0xffffffff)
+
 
 class SimulatedDataProvider:
     """Provides simulated data based on hydrogeological principles."""
@@ -29,6 +87,9 @@ class SimulatedDataProvider:
             'coastal': 1200,  # Coastal
             'northern': 400   # Arid
         }
+        self._region_precip = np.array([self.regional_precip[r] for r in _REGIONS])
+        
+        self._rng = np.random.default_rng()
     
     def generate_features(self, lat: float, lon: float) -> Dict[str, float]:
         """
@@ -41,76 +102,102 @@ class SimulatedDataProvider:
         Returns:
             Dictionary of features
         """
+        batch = self.generate_features_batch(
+            np.array([lat]), np.array([lon]), rng=_location_rng(lat, lon)
+        )
+        features = {name: float(values[0]) for name, values in batch.items()}
+        
+        logger.info(f"Generated simulated features for ({lat}, {lon}): {features}")
+        return features
+    
+    def generate_features_batch(
+        self,
+        lats: np.ndarray,
+        lons: np.ndarray,
+        rng: Optional[np.random.Generator] = None,
+        dtype: np.dtype = np.float64
+    ) -> Dict[str, np.ndarray]:
+        """
+        Generate realistic features for many locations at once.
+        
+        Args:
+            lats: Latitudes
+            lons: Longitudes
+            rng: Random generator (default: the provider's own)
+            dtype: Dtype of the returned arrays; float32 halves the memory of
+                large grids and matches the model's feature matrix
+            
+        Returns:
+            Dictionary of feature arrays, one value per location
+        """
+        lats = np.asarray(lats, dtype=float)
+        lons = np.asarray(lons, dtype=float)
+        rng = self._rng if rng is None else rng
+        
+        # All random draws for the batch in one call:
+        # elevation, slope, precipitation, temperature, NDVI, land cover
+        u = rng.random((6, lats.size))
+        
         # Determine region
-        region = self._determine_region(lat, lon)
-        
-        # Generate elevation (Kenya: 0-5199m, Mt Kenya)
-        # Higher in central/western, lower in coastal/northern
-        if region == 'central':
-            elevation = np.random.uniform(1200, 2500)
-        elif region == 'western':
-            elevation = np.random.uniform(1000, 2000)
-        elif region == 'coastal':
-            elevation = np.random.uniform(0, 500)
-        elif region == 'northern':
-            elevation = np.random.uniform(300, 1000)
-        else:  # eastern
-            elevation = np.random.uniform(500, 1500)
+        region = _region_codes(lats, lons)
+        
+        # Range-conditional draws gather their bounds from small tables and
+        # are computed in place over the random rows, so each feature costs
+        # one array rather than a temporary per branch
+        
+        # Generate elevation (m)
+        elevation = u[0]
+        elevation *= _ELEVATION_SPAN[region]
+        elevation += _ELEVATION_LOW[region]
         
         # Generate slope (degrees)
         # Steeper in highlands, flatter in lowlands
-        if elevation > 1500:
-            slope = np.random.uniform(5, 25)
-        else:
-            slope = np.random.uniform(0, 10)
+        highland = (elevation > 1500).astype(np.intp)
+        slope = u[1]
+        slope *= _SLOPE_SPAN[highland]
+        slope += _SLOPE_LOW[highland]
         
         # Generate precipitation
-        base_precip = self.regional_precip.get(region, 800)
-        precip_mean = base_precip * np.random.uniform(0.8, 1.2)
+        precip_mean = u[2]
+        precip_mean *= 0.4
+        precip_mean += 0.8
+        precip_mean *= self._region_precip[region]
         
         # Generate temperature (°C)
-        # Cooler at higher elevations
-        base_temp = 25 - (elevation / 1000) * 6  # Lapse rate ~6°C/1000m
-        temp_mean = base_temp + np.random.uniform(-2, 2)
+        # Cooler at higher elevations: lapse rate ~6°C/1000m, ±2°C noise
+        temp_mean = u[3]
+        temp_mean *= 4
+        temp_mean += 23 - elevation * 0.006
         
         # Generate NDVI (0-1)
         # Higher in wetter regions
-        if precip_mean > 1200:
-            ndvi = np.random.uniform(0.6, 0.85)
-        elif precip_mean > 800:
-            ndvi = np.random.uniform(0.4, 0.7)
-        else:
-            ndvi = np.random.uniform(0.2, 0.5)
+        wetness = (precip_mean > 800).astype(np.intp) + (precip_mean > 1200)
+        ndvi = u[4]
+        ndvi *= _NDVI_SPAN[wetness]
+        ndvi += _NDVI_LOW[wetness]
         
         # Calculate TWI (Topographic Wetness Index)
-        # Higher in flatter, wetter areas
-        slope_factor = max(0.1, slope / 30)
-        precip_factor = precip_mean / 1000
-        twi = (10 * precip_factor) / slope_factor
-        twi = np.clip(twi, 2, 20)
+        # Higher in flatter, wetter areas: 10 * (precip / 1000) / max(0.1, slope / 30)
+        twi = np.maximum(slope, 3.0)
+        np.divide(precip_mean * 0.3, twi, out=twi)
+        np.clip(twi, 2, 20, out=twi)
         
         # Generate land cover (ESA WorldCover classes)
         # 10=Tree cover, 20=Shrubland, 30=Grassland, 40=Cropland, 50=Built-up
         # 60=Bare/sparse, 70=Snow/ice, 80=Water, 90=Wetland, 95=Mangroves, 100=Moss
-        if ndvi > 0.7:
-            landcover = np.random.choice([10, 40, 90], p=[0.5, 0.3, 0.2])
-        elif ndvi > 0.4:
-            landcover = np.random.choice([20, 30, 40], p=[0.3, 0.4, 0.3])
-        else:
-            landcover = np.random.choice([30, 60], p=[0.6, 0.4])
-        
-        features = {
-            'elevation': round(elevation, 1),
-            'slope': round(slope, 2),
-            'twi': round(twi, 2),
-            'precip_mean': round(precip_mean, 1),
-            'temp_mean': round(temp_mean, 1),
-            'ndvi': round(ndvi, 3),
-            'landcover': float(landcover)
-        }
+        ndvi_group = (ndvi > 0.4).astype(int) + (ndvi > 0.7)
+        choice = (u[5][:, None] >= _LANDCOVER_CUM_P[ndvi_group]).sum(axis=1)
+        landcover = _LANDCOVER_CLASSES[ndvi_group, np.minimum(choice, 2)]
         
-        logger.info(f"Generated simulated features for ({lat}, {lon}): {features}")
-        return features
+        return {
+            'elevation': np.round(elevation, 1).astype(dtype, copy=False),
+            'slope': np.round(slope, 2).astype(dtype, copy=False),
+            'twi': np.round(twi, 2).astype(dtype, copy=False),
+            'precip_mean': np.round(precip_mean, 1).astype(dtype, copy=False),
+            'temp_mean': np.round(temp_mean, 1).astype(dtype, copy=False),
+            'ndvi': np.round(ndvi, 3).astype(dtype, copy=False),
+            'landcover': landcover.astype(dtype)
+        }
     
     def generate_climate_timeseries(
         self,
@@ -129,52 +216,28 @@ class SimulatedDataProvider:
         Returns:
             Dictionary with precipitation and temperature time series
         """
-        region = self._determine_region(lat, lon)
-        base_precip = self.regional_precip.get(region, 800) / 12  # Monthly
-        
-        # Kenya bimodal rainfall pattern
-        seasonal_patterns = {
-            1: 0.4, 2: 0.5, 3: 1.8, 4: 2.2, 5: 1.5,  # Long rains
-            6: 0.6, 7: 0.5, 8: 0.5, 9: 0.6,
-            10: 1.4, 11: 1.8, 12: 1.2  # Short rains
-        }
+        region = _region_codes(np.array(lat), np.array(lon))
+        base_precip = self._region_precip[region] / 12  # Monthly
         
-        precipitation = []
-        temperature = []
+        rng = _location_rng(lat, lon)
         
-        current_date = datetime.now()
+        # Month number of each step, stepping back 30 days at a time
+        today = np.datetime64(datetime.now().date(), 'D')
+        month_dates = today - 30 * np.arange(months, 0, -1)
+        month_num = month_dates.astype('datetime64[M]').astype(int) % 12 + 1
         
-        for i in range(months):
-            month_date = current_date - timedelta(days=30 * (months - i))
-            month_num = month_date.month
-            
-            # Generate precipitation with seasonality and noise
-            seasonal_factor = seasonal_patterns[month_num]
-            monthly_precip = base_precip * seasonal_factor * np.random.uniform(0.7, 1.3)
-            precipitation.append(round(monthly_precip, 1))
-            
-            # Generate temperature with seasonality
-            # Warmer in Jan-Mar, cooler in Jun-Aug
-            temp_seasonal = 22 + 3 * np.sin((month_num - 3) * np.pi / 6)
-            temp = temp_seasonal + np.random.uniform(-1, 1)
-            temperature.append(round(temp, 1))
+        # Precipitation with seasonality and noise
+        precipitation = base_precip * _SEASONAL_PRECIP[month_num] * rng.uniform(0.7, 1.3, months)
+        
+        # Temperature with seasonality
+        # Warmer in Jan-Mar, cooler in Jun-Aug
+        temperature = 22 + 3 * np.sin((month_num - 3) * np.pi / 6) + rng.uniform(-1, 1, months)
+        
+        precipitation = np.round(precipitation, 1).tolist()
+        temperature = np.round(temperature, 1).tolist()
         
         return {
             'precipitation': precipitation,
             'temperature': temperature,
             'months': months
         }
-    
-    def _determine_region(self, lat: float, lon: float) -> str:
-        """Determine which region of Kenya a location is in."""
-        # Simplified regional classification
-        if lon < 35.5:
-            return 'western'
-        elif lon > 39.5:
-            return 'coastal'
-        elif lat > 0.5:
-            return 'northern'
-        elif 36.5 <= lon <= 37.5 and -1.5 <= lat <= 0.5:
-            return 'central'
-        else:
-            return 'eastern'
@@ -0,0 +1,7 @@
+"""Pytest configuration for backend tests."""
+
+import sys
+from pathlib import Path
+
+# Backend modules import each other by bare name
+sys.path.insert(0, str(Path(__file__).parent.parent))
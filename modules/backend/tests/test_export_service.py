@@ -0,0 +1,106 @@
+"""Tests for streamed exports."""
+
+import csv
+import io
+
+import pytest
+
+import export_service
+from export_service import ExportService
+from model_service import forecast_rows
+
+
+@pytest.fixture
+def service():
+    """Create export service."""
+    return ExportService()
+
+
+def _history(n):
+    """Prediction history with n entries, including non-ASCII and quoted fields."""
+    return {
+        'history': [
+            {
+                'timestamp': f'2024-01-01T00:00:{i % 60:02d}',
+                'location': {'lat': -1.0 - i * 1e-4, 'lon': 36.8 + i * 1e-4},
+                'prediction': 'present' if i % 2 else 'absent',
+                'probability': round(0.5 + (i % 50) / 100, 2),
+                'data_source': 'Sentinel-2, "réel"' if i % 7 == 0 else 'gee'
+            }
+            for i in range(n)
+        ]
+    }
+
+
+def _history_csv(data):
+    """History CSV written to a string in one go, as before streaming."""
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow([
+        'Timestamp', 'Latitude', 'Longitude', 'Prediction', 'Probability', 'Data_Source'
+    ])
+    for item in data['history']:
+        loc = item['location']
+        writer.writerow([
+            item['timestamp'], loc['lat'], loc['lon'],
+            item['prediction'], item['probability'], item['data_source']
+        ])
+    return output.getvalue()
+
+
+def test_streamed_history_csv_matches_single_write(service):
+    """Test the streamed chunks join to the CSV written in one go."""
+    data = _history(5000)
+    
+    chunks = list(service.export_csv_iter(data, 'history'))
+    
+    assert b''.join(chunks).decode('utf-8') == _history_csv(data)
+    assert len(chunks) > 1
+    assert all(len(chunk) < 2 * export_service._STREAM_CHUNK_SIZE for chunk in chunks)
+
+
+def test_streamed_forecast_csv_accepts_columns_and_records(service):
+    """Test a columnar forecast exports the same CSV as its per-month records."""
+    columns = {
+        'month': ['2024-01', '2024-02'],
+        'precipitation_mm': [26.8, 33.5],
+        'recharge_mm': [4.02, 5.1],
+        'extraction_mm': [3.94, 5.0],
+        'net_change_mm': [0.08, 0.1],
+        'cumulative_storage_mm': [0.1, 0.2],
+        'confidence': [0.92, 0.89]
+    }
+    
+    from_columns = service.export_csv({'forecast': columns}, 'forecast')
+    from_records = service.export_csv({'forecast': forecast_rows(columns)}, 'forecast')
+    
+    assert from_columns == from_records
+    assert from_columns.splitlines()[1] == '2024-01,26.8,4.02,3.94,0.08,0.1,0.92'
+
+
+def test_prediction_csv_layout(service):
+    """Test the prediction export keeps its summary row and depth band section."""
+    data = {
+        'location': {'lat': -1.29, 'lon': 36.82},
+        'prediction': 'present',
+        'probability': 0.71,
+        'confidence_interval': [0.59, 0.79],
+        'geological_formation': 'Sedimentary (Alluvial)',
+        'estimated_porosity': 'High (25-35%)',
+        'recommended_drilling_depth': '0-30m',
+        'timestamp': '2024-01-01T00:00:00',
+        'depth_bands': [{
+            'depth_range': '0-30m', 'probability': 0.639, 'quality': 'good',
+            'yield_lpm': '30-60', 'aquifer_type': 'Unconfined', 'recharge_rate': 'High'
+        }]
+    }
+    
+    assert service.export_csv(data, 'prediction') == (
+        'Latitude,Longitude,Prediction,Probability,Confidence_Low,Confidence_High,'
+        'Geological_Formation,Porosity,Recommended_Depth,Timestamp\r\n'
+        '-1.29,36.82,present,0.71,0.59,0.79,Sedimentary (Alluvial),High (25-35%),'
+        '0-30m,2024-01-01T00:00:00\r\n'
+        '\n\nDepth Bands\n'
+        'Depth_Range,Probability,Quality,Yield_LPM,Aquifer_Type,Recharge_Rate\r\n'
+        '0-30m,0.639,good,30-60,Unconfined,High\r\n'
+    )
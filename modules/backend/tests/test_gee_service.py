@@ -0,0 +1,295 @@
+"""Tests for GEE service helpers and regional statistics."""
+
+import asyncio
+import math
+import numpy as np
+import pytest
+from unittest.mock import MagicMock, patch
+
+import gee_service
+from gee_service import (
+    GEEService, clip_bounds, landcover_name, merge_tile_stats, region_tiles, summarize_series,
+    tile_bounds, topographic_wetness_index
+)
+
+
+# Nairobi preview region; lies inside a single zoom-7 tile
+NAIROBI_BBOX = [36.6, -1.5, 37.1, -1.1]
+
+
+@pytest.fixture
+def service():
+    """Create GEE service instance (not initialized)."""
+    return GEEService()
+
+
+def _reduction(band, mean, std, minimum, maximum, count):
+    """reduceRegion output of the combined mean/minMax/stdDev/count reducer."""
+    return {
+        f"{band}_mean": mean,
+        f"{band}_stdDev": std,
+        f"{band}_min": minimum,
+        f"{band}_max": maximum,
+        f"{band}_count": count
+    }
+
+
+def _run_tiled_stats(service, bbox, reduce_fn):
+    """Run _tiled_region_stats against a mocked Earth Engine."""
+    rectangles = []
+    
+    def rectangle(bounds):
+        rectangles.append(bounds)
+        return bounds
+    
+    async def ee_get(reductions):
+        return {key: reduce_fn(bounds) for key, bounds in reductions.items()}
+    
+    with patch.object(gee_service, 'ee') as mock_ee:
+        mock_ee.Geometry.Rectangle.side_effect = rectangle
+        mock_ee.Dictionary.side_effect = lambda d: d
+        image_fn = MagicMock()
+        image_fn.return_value.reduceRegion.side_effect = lambda geometry, **kwargs: geometry
+        service._ee_get = ee_get
+        stats = asyncio.run(service._tiled_region_stats('test', bbox, image_fn, 100))
+    return stats, rectangles
+
+
+def test_clip_bounds():
+    """Test box intersection."""
+    assert clip_bounds([0, 0, 10, 10], [5, -5, 15, 5]) == [5, 0, 10, 5]
+    assert clip_bounds([0, 0, 10, 10], [10, 0, 20, 10]) is None
+
+
+def test_sub_tile_bbox_reduced_over_bbox(service):
+    """Test a bbox inside one tile is reduced over the bbox itself, as before tiling."""
+    assert len(region_tiles(NAIROBI_BBOX)) == 1
+    bbox_reduction = _reduction('NDVI', 0.42, 0.11, -0.2, 0.91, 5000)
+    
+    stats, rectangles = _run_tiled_stats(service, NAIROBI_BBOX, lambda bounds: bbox_reduction)
+    
+    assert rectangles == [NAIROBI_BBOX]
+    assert stats == {'NDVI': {'mean': 0.42, 'std': 0.11, 'min': -0.2, 'max': 0.91}}
+
+
+def test_multi_tile_bbox_clipped_to_bbox(service):
+    """Test tiles of a larger bbox are clipped so together they cover exactly the bbox."""
+    bbox = [33.9, -4.7, 41.9, 5.5]
+    
+    stats, rectangles = _run_tiled_stats(
+        service, bbox, lambda bounds: _reduction('precipitation', 2.0, 0.0, 1.0, 3.0, 10)
+    )
+    
+    assert len(rectangles) > 1
+    for west, south, east, north in rectangles:
+        assert bbox[0] <= west < east <= bbox[2]
+        assert bbox[1] <= south < north <= bbox[3]
+    area = sum((e - w) * (n - s) for w, s, e, n in rectangles)
+    assert area == pytest.approx((bbox[2] - bbox[0]) * (bbox[3] - bbox[1]))
+    assert stats['precipitation']['mean'] == pytest.approx(2.0)
+
+
+def test_merge_tile_stats_pools_tiles():
+    """Test merged stats equal those of the pooled pixels."""
+    tiles = [
+        _reduction('b', 1.0, 0.0, 1.0, 1.0, 3),
+        _reduction('b', 3.0, 0.0, 3.0, 3.0, 1)
+    ]
+    
+    stats = merge_tile_stats(tiles)['b']
+    
+    assert stats['mean'] == pytest.approx(1.5)
+    assert stats['std'] == pytest.approx(0.75 ** 0.5)
+    assert (stats['min'], stats['max']) == (1.0, 3.0)
+
+
+def test_tile_bounds_contain_bbox_corners():
+    """Test the covering tiles enclose the bbox."""
+    tiles = [tile_bounds(x, y) for x, y in region_tiles(NAIROBI_BBOX)]
+    west, south, east, north = tiles[0]
+    assert west <= NAIROBI_BBOX[0] and NAIROBI_BBOX[2] <= east
+    assert south <= NAIROBI_BBOX[1] and NAIROBI_BBOX[3] <= north
+
+
+def test_sentinel2_regional_reduces_over_region(service):
+    """Test the S2 NDVI composite is reduced over the requested region, not grid tiles."""
+    region = MagicMock(name='region')
+    
+    async def ee_get(request):
+        return {'count': 4, 'stats': {'NDVI_mean': 0.5, 'NDVI_min': 0.1, 'NDVI_max': 0.8}}
+    
+    with patch.object(gee_service, 'ee') as mock_ee:
+        mock_ee.Dictionary.side_effect = lambda d=None: d
+        service._ee_get = ee_get
+        service._tiled_region_stats = MagicMock(side_effect=AssertionError("tiled"))
+        s2 = MagicMock()
+        service.__dict__['_s2'] = s2
+        stats = asyncio.run(service._get_sentinel2_regional(region, '2024-01-01', '2024-03-01'))
+    
+    collection = s2.filterDate.return_value.filterBounds.return_value.filter.return_value
+    composite = collection.select.return_value.median.return_value \
+        .normalizedDifference.return_value.rename.return_value
+    assert composite.reduceRegion.call_args.kwargs['geometry'] is region
+    assert (stats['mean'], stats['min'], stats['max']) == (0.5, 0.1, 0.8)
+    assert stats['total_images'] == 4
+
+
+def test_worldcover_regional_class_names(service):
+    """Test regional class names match the original labels, with a Class N fallback."""
+    async def ee_get(request):
+        return {'60': 120, '80': 30, '42': 5}
+    
+    with patch.object(gee_service, 'ee'):
+        service._ee_get = ee_get
+        service.__dict__['_worldcover'] = MagicMock()
+        stats = asyncio.run(service._get_worldcover_regional(MagicMock()))
+    
+    assert stats['class_distribution'] == {
+        'Bare/sparse vegetation': 120,
+        'Water bodies': 30,
+        'Class 42': 5
+    }
+    assert stats['dominant_class'] == 'Bare/sparse vegetation'
+
+
+def test_topographic_wetness_index_matches_formula():
+    """Test TWI equals ln(a / tan(slope)) for scalars and arrays alike."""
+    slopes = np.array([1.0, 5.0, 12.5, 30.0, 60.0])
+    expected = [math.log(100 / math.tan(math.radians(s))) for s in slopes]
+    
+    assert topographic_wetness_index(slopes, 100) == pytest.approx(expected)
+    assert [topographic_wetness_index(s, 100) for s in slopes] == pytest.approx(expected)
+
+
+def test_topographic_wetness_index_flat_terrain():
+    """Test flat terrain uses the floored tan(slope) instead of dividing by zero."""
+    assert topographic_wetness_index(0.0, 100) == pytest.approx(math.log(100 / 1e-3))
+
+
+def test_summarize_series_matches_float64_reduction():
+    """Test the float32 summary matches a float64 reduction of the same values."""
+    values = list(np.random.default_rng(0).uniform(280.0, 310.0, 500))
+    expected = np.array(values) - 273.15
+    
+    stats = summarize_series(values, offset=-273.15)
+    
+    assert stats['min'] == pytest.approx(expected.min(), abs=1e-4)
+    assert stats['max'] == pytest.approx(expected.max(), abs=1e-4)
+    assert stats['mean'] == pytest.approx(expected.mean(), abs=1e-4)
+    assert stats['std'] == pytest.approx(expected.std(), abs=1e-4)
+
+
+def test_summarize_series_ignores_missing_values():
+    """Test None samples are left out of the summary."""
+    stats = summarize_series([1.0, None, 3.0, None, 5.0])
+    
+    assert stats == pytest.approx({'min': 1.0, 'max': 5.0, 'mean': 3.0, 'std': np.std([1.0, 3.0, 5.0])})
+
+
+# Point land cover names from before the lookup table
+_LC_POINT_NAMES = {
+    10: 'Tree cover', 20: 'Shrubland', 30: 'Grassland', 40: 'Cropland',
+    50: 'Built-up', 60: 'Bare / sparse vegetation', 70: 'Snow and ice',
+    80: 'Permanent water bodies', 90: 'Herbaceous wetland', 95: 'Mangroves',
+    100: 'Moss and lichen'
+}
+
+
+def test_landcover_name_matches_class_dict():
+    """Test the lookup table gives the same names as the class dict, including unknowns."""
+    values = list(range(-5, 110))
+    expected = [_LC_POINT_NAMES.get(v, 'Unknown') for v in values]
+    
+    assert [landcover_name(v) for v in values] == expected
+    assert list(landcover_name(np.array(values))) == expected
+
+
+def _interpret_ndvi_chain(ndvi_value):
+    """NDVI classification as the original if/elif chain."""
+    if ndvi_value < 0:
+        return 'Water or snow'
+    elif ndvi_value < 0.2:
+        return 'Bare soil or rock'
+    elif ndvi_value < 0.4:
+        return 'Sparse vegetation'
+    elif ndvi_value < 0.6:
+        return 'Moderate vegetation'
+    return 'Dense vegetation'
+
+
+def test_interpret_ndvi_matches_threshold_chain(service):
+    """Test searchsorted classification agrees with the chain, on and between the bounds."""
+    values = [-1.0, -0.01, 0.0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.99, 1.0]
+    expected = [_interpret_ndvi_chain(v) for v in values]
+    
+    assert [service._interpret_ndvi(v) for v in values] == expected
+    assert list(service._interpret_ndvi(np.array(values))) == expected
+
+
+def test_single_flight_shares_one_fetch(service):
+    """Test concurrent callers with one key share a single fetch."""
+    calls = []
+    
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {'value': len(calls)}
+    
+    async def run():
+        results = await asyncio.gather(*(service._single_flight('key', fetch) for _ in range(5)))
+        again = await service._single_flight('key', fetch)
+        return results, again
+    
+    results, again = asyncio.run(run())
+    
+    assert results == [{'value': 1}] * 5
+    assert again == {'value': 2}
+    assert not service._inflight
+
+
+def test_single_flight_survives_cancelled_caller(service):
+    """Test cancelling one caller leaves the shared fetch running for the others."""
+    async def fetch():
+        await asyncio.sleep(0.01)
+        return 'done'
+    
+    async def run():
+        first = asyncio.ensure_future(service._single_flight('key', fetch))
+        second = asyncio.ensure_future(service._single_flight('key', fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+    
+    assert asyncio.run(run()) == 'done'
+
+
+def test_regional_stats_serve_stale_and_refresh_once(service):
+    """Test an expired temporal result is served stale while one refresh recomputes it."""
+    calls = []
+    
+    async def fetch_regional_stats(dataset_id, bbox, bbox_key, start_date, end_date, cache, cache_key):
+        calls.append(cache_key)
+        await asyncio.sleep(0.01)
+        stats = {'mean': 2.0}
+        await cache.set(cache_key, stats)
+        return stats
+    
+    async def run():
+        service.initialized = True
+        service._fetch_regional_stats = fetch_regional_stats
+        cache_key = f"chirps|{','.join(f'{v:.4f}' for v in NAIROBI_BBOX)}|2024-01-01|2024-02-01|v5"
+        await service._regional_stale_cache.set(cache_key, {'mean': 1.0})
+        
+        stale = await asyncio.gather(*(
+            service.get_regional_stats('chirps', NAIROBI_BBOX, '2024-01-01', '2024-02-01')
+            for _ in range(3)
+        ))
+        await asyncio.gather(*service._background_tasks)
+        fresh = await service.get_regional_stats('chirps', NAIROBI_BBOX, '2024-01-01', '2024-02-01')
+        return stale, fresh
+    
+    stale, fresh = asyncio.run(run())
+    
+    assert stale == [{'mean': 1.0}] * 3
+    assert fresh == {'mean': 2.0}
+    assert len(calls) == 1
@@ -0,0 +1,129 @@
+"""Tests for API endpoints."""
+
+import numpy as np
+import pytest
+
+# main mounts the Oracle router, which needs the Oracle driver
+pytest.importorskip("oracledb")
+
+from fastapi.testclient import TestClient
+
+import main
+
+
+class _TWIModel:
+    """Classifier whose probability follows the TWI column."""
+    
+    def predict_proba(self, X):
+        p = np.clip(X[:, 2] / 20.0, 0.0, 1.0)
+        return np.column_stack([1 - p, p])
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Create test client with a deterministic aquifer model."""
+    monkeypatch.setattr(main.model_service, "aquifer_model", _TWIModel())
+    return TestClient(main.app)
+
+
+def _prediction_request(i):
+    """Simulated-data prediction request for the i-th test location."""
+    return {"location": {"lat": -1.0 - 0.1 * i, "lon": 36.5 + 0.2 * i}, "use_real_data": False}
+
+
+def test_batch_prediction_matches_single_predictions(client):
+    """Test the batch endpoint returns what the single endpoint returns for each location."""
+    batch = [_prediction_request(i) for i in range(3)]
+    batch.append({
+        "location": {"lat": -0.5, "lon": 37.2},
+        "features": {
+            "elevation": 1200.0, "slope": 4.0, "twi": 11.0, "precip_mean": 900.0,
+            "temp_mean": 21.0, "ndvi": 0.5, "landcover": 40.0
+        }
+    })
+    
+    response = client.post("/api/v1/predict/aquifer/batch", json=batch)
+    singles = [client.post("/api/v1/predict/aquifer", json=req).json() for req in batch]
+    
+    assert response.status_code == 200
+    results = response.json()
+    assert [r["data_source"] for r in results] == ["simulated"] * 3 + ["provided"]
+    for result, single in zip(results, singles):
+        result.pop("timestamp")
+        single.pop("timestamp")
+    assert results == singles
+
+
+@pytest.mark.parametrize("size", [0, main._MAX_PREDICTION_BATCH + 1])
+def test_batch_prediction_rejects_batch_size(client, size):
+    """Test empty and oversized batches are rejected before any work is done."""
+    batch = [_prediction_request(0)] * size
+    
+    response = client.post("/api/v1/predict/aquifer/batch", json=batch)
+    
+    assert response.status_code == 422
+
+
+@pytest.fixture
+def gee(monkeypatch):
+    """Stand in for an available Earth Engine with fixed statistics."""
+    async def get_regional_stats(dataset_id, bbox, start_date=None, end_date=None):
+        return {"mean": 2.5, "date_range": ["2024-01-01", "2024-02-01"]}
+    
+    async def get_tile_url(dataset_id, start_date=None, end_date=None):
+        return f"https://tiles.example/{dataset_id}/{{z}}/{{x}}/{{y}}"
+    
+    monkeypatch.setattr(main.gee_service, "is_available", lambda: True)
+    monkeypatch.setattr(main.gee_service, "get_regional_stats", get_regional_stats)
+    monkeypatch.setattr(main.gee_service, "get_tile_url", get_tile_url)
+    return main.gee_service
+
+
+def test_settings_revalidated_with_etag(client):
+    """Test settings carry an ETag and a matching If-None-Match gets a bodiless 304."""
+    first = client.get("/api/v1/settings")
+    
+    assert first.status_code == 200
+    assert first.json() == main.settings_service.get_settings()
+    
+    second = client.get("/api/v1/settings", headers={"If-None-Match": first.headers["etag"]})
+    
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == first.headers["etag"]
+
+
+def test_preview_etag_ignores_timestamp(client, gee, monkeypatch):
+    """Test a preview ETag covers the content only, so a later timestamp still gets a 304."""
+    first = client.get("/api/v1/data/preview/chirps")
+    monkeypatch.setattr(main, "_utcnow", lambda: "2099-01-01T00:00:00+00:00")
+    second = client.get("/api/v1/data/preview/chirps")
+    revalidated = client.get(
+        "/api/v1/data/preview/chirps", headers={"If-None-Match": first.headers["etag"]}
+    )
+    
+    assert first.status_code == second.status_code == 200
+    assert first.json()["timestamp"] != second.json()["timestamp"]
+    assert first.headers["etag"] == second.headers["etag"]
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+
+
+def test_batch_preview_matches_single_previews(client, gee, monkeypatch):
+    """Test each preview in a batch carries the statistics and tile URL of its single preview."""
+    async def get_regional_summary(bbox, start_date, end_date, dataset_ids):
+        return {d: await gee.get_regional_stats(d, bbox, start_date, end_date) for d in dataset_ids}
+    
+    monkeypatch.setattr(gee, "get_regional_summary", get_regional_summary)
+    
+    response = client.post(
+        "/api/v1/data/preview/batch", json={"dataset_ids": ["chirps", "era5", "chirps"]}
+    )
+    
+    assert response.status_code == 200
+    previews = response.json()["previews"]
+    assert list(previews) == ["chirps", "era5"]
+    for dataset_id, preview in previews.items():
+        single = client.get(f"/api/v1/data/preview/{dataset_id}").json()
+        for key in ("dataset_id", "tile_url", "statistics", "start_date", "end_date"):
+            assert preview[key] == single[key]
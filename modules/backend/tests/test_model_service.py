@@ -0,0 +1,160 @@
+"""Tests for model service predictions and forecasts."""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+import model_service
+from model_service import ModelService
+
+
+class _TWIModel:
+    """Classifier whose probability follows the TWI column, recording each call."""
+    
+    def __init__(self):
+        self.calls = []
+    
+    def predict_proba(self, X):
+        self.calls.append(X.shape)
+        p = np.clip(X[:, 2] / 20.0, 0.0, 1.0)
+        return np.column_stack([1 - p, p])
+
+
+@pytest.fixture
+def service(tmp_path):
+    """Create model service with no trained models."""
+    return ModelService(str(tmp_path))
+
+
+def _locations(n):
+    """Feature dictionaries for n distinct locations."""
+    return [
+        {
+            'elevation': 800.0 + 100 * i, 'slope': 2.0 + i, 'twi': 4.0 + i,
+            'precip_mean': 600.0 + 50 * i, 'temp_mean': 22.0, 'ndvi': 0.4, 'landcover': 40
+        }
+        for i in range(n)
+    ]
+
+
+def test_predict_aquifer_batch_matches_single_predictions(service):
+    """Test a batch gives the same results as predicting each location alone, in one model call."""
+    service.aquifer_model = _TWIModel()
+    locations = _locations(12)
+    
+    batch = service.predict_aquifer_batch(locations)
+    
+    assert service.aquifer_model.calls == [(12, 7)]
+    assert batch == [service.predict_aquifer(features) for features in locations]
+
+
+def test_concurrent_async_predictions_share_one_model_call(service):
+    """Test concurrent async predictions are micro-batched and match direct predictions."""
+    service.aquifer_model = _TWIModel()
+    locations = _locations(8)
+    
+    async def run():
+        return await asyncio.gather(*(service.predict_aquifer_async(f) for f in locations))
+    
+    results = asyncio.run(run())
+    
+    assert service.aquifer_model.calls == [(8, 7)]
+    assert results == service.predict_aquifer_batch(locations)
+    assert not service._pending
+
+
+def test_async_prediction_batch_flushes_at_max_size(service, monkeypatch):
+    """Test a full batch is sent without waiting for the window."""
+    monkeypatch.setattr(model_service, '_MAX_BATCH_SIZE', 3)
+    monkeypatch.setattr(model_service, '_BATCH_WINDOW_S', 60)
+    service.aquifer_model = _TWIModel()
+    
+    async def run():
+        return await asyncio.wait_for(
+            asyncio.gather(*(service.predict_aquifer_async(f) for f in _locations(3))), 5
+        )
+    
+    assert len(asyncio.run(run())) == 3
+    assert service.aquifer_model.calls == [(3, 7)]
+
+
+def _water_balance_loop(avg_precip, noise):
+    """Monthly water balance as the original per-month loop, with the given noise draws."""
+    seasonal_patterns = {
+        1: 0.4, 2: 0.5, 3: 1.8, 4: 2.2, 5: 1.5, 6: 0.6,
+        7: 0.5, 8: 0.5, 9: 0.6, 10: 1.4, 11: 1.8, 12: 1.2
+    }
+    forecast = []
+    cumulative_storage = 0
+    for i, factor in enumerate(noise):
+        month_date = datetime.now() + timedelta(days=30 * i)
+        monthly_precip = avg_precip * seasonal_patterns[month_date.month]
+        recharge = monthly_precip * 0.15 * factor
+        extraction = recharge * 0.7 * (1.4 if month_date.month in [1, 2, 6, 7, 8, 9] else 0.9)
+        net_change = recharge - extraction
+        cumulative_storage += net_change
+        forecast.append({
+            "month": month_date.strftime("%Y-%m"),
+            "precipitation_mm": round(monthly_precip, 1),
+            "recharge_mm": round(recharge, 2),
+            "extraction_mm": round(extraction, 2),
+            "net_change_mm": round(net_change, 2),
+            "cumulative_storage_mm": round(cumulative_storage, 1),
+            "confidence": round(0.92 - (i * 0.03), 2)
+        })
+    return forecast
+
+
+def test_water_balance_forecast_matches_monthly_loop(service):
+    """Test the vectorized forecast equals the per-month loop for the same noise."""
+    horizon = 24
+    noise = np.random.default_rng(7).uniform(0.85, 1.15, horizon)
+    service._rng = np.random.default_rng(7)
+    
+    result = service.forecast_recharge({'precipitation': [40.0, 90.0, 120.0]}, horizon)
+    expected = _water_balance_loop(np.mean([40.0, 90.0, 120.0]), noise)
+    
+    assert [row['month'] for row in result['forecast']] == [row['month'] for row in expected]
+    for row, expected_row in zip(result['forecast'], expected):
+        for key, value in expected_row.items():
+            if key != 'month':
+                assert row[key] == pytest.approx(value)
+    total_recharge = sum(row['recharge_mm'] for row in expected)
+    assert result['summary']['total_recharge_mm'] == pytest.approx(total_recharge, abs=0.01)
+
+
+def _depth_bands_chain(features, base_prob):
+    """Depth band probability, quality and yield as the original per-band branches."""
+    twi_score = min(features['twi'] / 20.0, 1.0)
+    precip_score = min(features['precip_mean'] / 1500.0, 1.0)
+    elev_score = 1.0 - min(features['elevation'] / 3000.0, 1.0)
+    bands = [
+        (base_prob * (0.9 if twi_score > 0.6 else 0.6), 0.95, 0.7,
+         ("excellent", "good"), ("50-100", "30-60")),
+        (base_prob * (0.75 if precip_score > 0.5 else 0.5), 0.90, 0.6,
+         ("good", "moderate"), ("30-70", "20-45")),
+        (base_prob * (0.5 if elev_score > 0.4 else 0.3), 0.80, 0.4,
+         ("moderate", "low"), ("15-40", "10-25")),
+        (base_prob * 0.25, 0.60, 0.2, ("low", "very_low"), ("5-20", "2-10"))
+    ]
+    return [
+        (round(min(prob, cap), 3), quality[prob <= threshold], yield_lpm[prob <= threshold])
+        for prob, cap, threshold, quality, yield_lpm in bands
+    ]
+
+
+@pytest.mark.parametrize('twi', [4.0, 12.0, 12.01, 25.0])
+@pytest.mark.parametrize('precip_mean', [300.0, 750.0, 751.0, 2000.0])
+@pytest.mark.parametrize('elevation', [400.0, 1799.0, 1800.0, 3500.0])
+def test_depth_bands_match_per_band_branches(service, twi, precip_mean, elevation):
+    """Test the vectorized depth bands agree with the per-band branches across thresholds."""
+    features = {'twi': twi, 'precip_mean': precip_mean, 'elevation': elevation}
+    
+    for base_prob in np.linspace(0.0, 1.0, 41):
+        bands = service._calculate_depth_bands(features, float(base_prob))
+        
+        assert [
+            (band['probability'], band['quality'], band['yield_lpm']) for band in bands
+        ] == _depth_bands_chain(features, float(base_prob))
@@ -0,0 +1,63 @@
+"""Tests for the settings service debounced persistence."""
+
+import orjson
+import pytest
+from unittest.mock import patch
+
+import settings_service
+from settings_service import SettingsService
+
+
+@pytest.fixture
+def service(tmp_path):
+    """Create settings service backed by a temporary file."""
+    return SettingsService(str(tmp_path / "settings.json"))
+
+
+def test_update_is_written_after_flush(service):
+    """Test pending updates reach the file on flush."""
+    service.update_settings({"theme": "dark"})
+    service.flush()
+    
+    saved = orjson.loads(service.settings_file.read_bytes())
+    assert saved == service.get_settings()
+    assert saved["general"]["theme"] == "dark"
+
+
+def test_burst_of_updates_writes_once(service):
+    """Test several updates before the debounce fires produce one write."""
+    with patch.object(service, "_write_settings", wraps=service._write_settings) as write:
+        service.set_setting("general", "theme", "dark")
+        service.set_setting("general", "language", "sw")
+        service.update_settings({"models": {"confidence_threshold": 0.9}})
+        service.flush()
+        service.flush()
+    
+    assert write.call_count == 1
+    saved = orjson.loads(service.settings_file.read_bytes())
+    assert saved["general"]["language"] == "sw"
+    assert saved["models"]["confidence_threshold"] == 0.9
+
+
+def test_timer_writes_snapshot_taken_at_change(service):
+    """Test the debounced write uses settings captured when the change was made."""
+    with patch.object(settings_service.threading, "Timer") as timer:
+        service.set_setting("general", "theme", "dark")
+        callback = timer.call_args[0][1]
+    
+    # Mutate in place without scheduling, as a concurrent caller might
+    service.settings["general"]["theme"] = "light"
+    callback()
+    
+    saved = orjson.loads(service.settings_file.read_bytes())
+    assert saved["general"]["theme"] == "dark"
+
+
+def test_reload_matches_saved_settings(service, tmp_path):
+    """Test a new instance loads what the previous one flushed."""
+    service.reset_to_defaults()
+    service.set_setting("notifications", "model_updates", True)
+    service.flush()
+    
+    reloaded = SettingsService(str(tmp_path / "settings.json"))
+    assert reloaded.get_settings() == service.get_settings()
@@ -0,0 +1,119 @@
+"""Tests for the simulated data provider."""
+
+import numpy as np
+import pytest
+
+from simulated_data import SimulatedDataProvider, _REGIONS, _region_codes
+
+
+# Per-region elevation ranges (m) from the original per-location draws
+_ELEVATION_RANGES = {
+    'western': (1000, 2000), 'central': (1200, 2500), 'eastern': (500, 1500),
+    'coastal': (0, 500), 'northern': (300, 1000)
+}
+
+# A location in each region
+_REGION_POINTS = {
+    'western': (0.3, 34.8), 'central': (-1.0, 37.0), 'eastern': (-2.5, 38.0),
+    'coastal': (-3.5, 39.8), 'northern': (3.0, 37.0)
+}
+
+
+@pytest.fixture
+def provider():
+    """Create simulated data provider."""
+    return SimulatedDataProvider()
+
+
+def _determine_region(lat, lon):
+    """Region of a location as the original if/elif rules."""
+    if lon < 35.5:
+        return 'western'
+    elif lon > 39.5:
+        return 'coastal'
+    elif lat > 0.5:
+        return 'northern'
+    elif 36.5 <= lon <= 37.5 and -1.5 <= lat <= 0.5:
+        return 'central'
+    return 'eastern'
+
+
+def test_region_codes_match_region_rules():
+    """Test vectorized region codes agree with the per-location rules, including edges."""
+    lats, lons = np.meshgrid(np.arange(-4.7, 5.6, 0.1), np.arange(33.9, 42.0, 0.1))
+    lats = np.append(lats.ravel(), [-1.5, 0.5, 0.5, -1.5])
+    lons = np.append(lons.ravel(), [36.5, 37.5, 35.5, 39.5])
+    
+    codes = _region_codes(lats, lons)
+    
+    assert [_REGIONS[c] for c in codes] == [
+        _determine_region(lat, lon) for lat, lon in zip(lats, lons)
+    ]
+
+
+@pytest.mark.parametrize('region', _REGIONS)
+def test_batch_features_follow_original_distributions(provider, region):
+    """Test each feature stays within the ranges and relations of the per-location draws."""
+    n = 20000
+    lat, lon = _REGION_POINTS[region]
+    f = provider.generate_features_batch(
+        np.full(n, lat), np.full(n, lon), rng=np.random.default_rng(0)
+    )
+    
+    low, high = _ELEVATION_RANGES[region]
+    assert f['elevation'].min() >= low and f['elevation'].max() <= high
+    assert f['elevation'].mean() == pytest.approx((low + high) / 2, rel=0.02)
+    
+    # Features are rounded after drawing, so values that round onto a
+    # threshold could have come from either side and are left out
+    highland = f['elevation'] > 1500
+    lowland = f['elevation'] < 1500
+    assert np.all((f['slope'][highland] >= 5) & (f['slope'][highland] <= 25))
+    assert np.all((f['slope'][lowland] >= 0) & (f['slope'][lowland] <= 10))
+    
+    base_precip = provider.regional_precip[region]
+    assert f['precip_mean'].min() >= 0.8 * base_precip - 0.05
+    assert f['precip_mean'].max() <= 1.2 * base_precip + 0.05
+    
+    base_temp = 25 - f['elevation'] * 0.006
+    assert np.all(np.abs(f['temp_mean'] - base_temp) <= 2.06)
+    
+    wet = f['precip_mean'] > 1200
+    moderate = (f['precip_mean'] > 800) & (f['precip_mean'] < 1200)
+    dry = f['precip_mean'] < 800
+    assert np.all((f['ndvi'][wet] >= 0.6) & (f['ndvi'][wet] <= 0.85))
+    assert np.all((f['ndvi'][moderate] >= 0.4) & (f['ndvi'][moderate] <= 0.7))
+    assert np.all((f['ndvi'][dry] >= 0.2) & (f['ndvi'][dry] <= 0.5))
+    
+    twi = np.clip((10 * f['precip_mean'] / 1000) / np.maximum(0.1, f['slope'] / 30), 2, 20)
+    assert f['twi'] == pytest.approx(twi, rel=2e-3, abs=0.006)
+
+
+def test_landcover_frequencies_match_original_probabilities(provider):
+    """Test land cover classes are drawn with the original per-NDVI-group probabilities."""
+    # Every region, so that all three NDVI groups are well populated
+    lats, lons = np.array(list(_REGION_POINTS.values())).T
+    f = provider.generate_features_batch(
+        np.repeat(lats, 50000), np.repeat(lons, 50000), rng=np.random.default_rng(1)
+    )
+    
+    groups = {
+        'dry': (f['ndvi'] < 0.4, {30: 0.6, 60: 0.4}),
+        'moderate': ((f['ndvi'] > 0.4) & (f['ndvi'] < 0.7), {20: 0.3, 30: 0.4, 40: 0.3}),
+        'dense': (f['ndvi'] > 0.7, {10: 0.5, 40: 0.3, 90: 0.2})
+    }
+    for mask, probabilities in groups.values():
+        classes = f['landcover'][mask]
+        assert set(np.unique(classes)) <= set(probabilities)
+        for value, p in probabilities.items():
+            assert np.mean(classes == value) == pytest.approx(p, abs=0.02)
+
+
+def test_generate_features_reproducible_per_location(provider):
+    """Test single-location features are stable for a location and match a one-row batch."""
+    first = provider.generate_features(-1.2921, 36.8219)
+    
+    assert provider.generate_features(-1.2921, 36.8219) == first
+    assert set(first) == {
+        'elevation', 'slope', 'twi', 'precip_mean', 'temp_mean', 'ndvi', 'landcover'
+    }
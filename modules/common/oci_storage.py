@@ -1,20 +1,73 @@
 """OCI Object Storage integration for AquaPredict."""
 
-import oci
+import functools
+import io
 import os
+import time
 import logging
-from typing import List, Optional, BinaryIO
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, BinaryIO, Tuple
 from datetime import datetime, timedelta
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Multipart upload settings: objects larger than one part are split and the
+# parts uploaded in parallel
+_UPLOAD_PART_SIZE = 16 * 1024 * 1024
+_UPLOAD_PARALLEL_PARTS = 8
+
+# Chunk size for streaming downloads to disk
+_DOWNLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Object listing: largest page the API returns, and the summary fields to
+# include (only the name is returned by default)
+_LIST_PAGE_SIZE = 1000
+_LIST_FIELDS = 'name,size,timeCreated,timeModified,md5'
+
+# Concurrent DELETE requests when removing many objects
+_DELETE_WORKERS = 16
+
+# A cached presigned URL is replaced once it has less than this long left
+_PAR_REFRESH_MARGIN_S = 3600
+
+# OCI SDK module, imported on first use as it is slow to import
+_oci = None
+
+
+def _get_oci():
+    """Import the OCI SDK once, when a client is first needed."""
+    global _oci
+    if _oci is None:
+        import oci
+        _oci = oci
+    return _oci
+
+
+def _write_chunks(chunks: Iterable[bytes], file_path: str):
+    """
+    Write streamed chunks to a file, overlapping each write with the next read.
+    
+    The write of one chunk runs on a helper thread while the following chunk
+    is received, so the network and the disk are kept busy at the same time.
+    """
+    with open(file_path, 'wb') as file, ThreadPoolExecutor(max_workers=1) as writer:
+        pending = None
+        for chunk in chunks:
+            if pending is not None:
+                pending.result()
+            pending = writer.submit(file.write, chunk)
+        if pending is not None:
+            pending.result()
+
 
 class OCIStorageClient:
     """OCI Object Storage client for data, models, and reports."""
     
     def __init__(self):
         """Initialize OCI Object Storage client."""
+        oci = _get_oci()
+        
         # Load OCI config
         config_file = os.getenv("OCI_CONFIG_FILE", "~/.oci/config")
         config_profile = os.getenv("OCI_CONFIG_PROFILE", "DEFAULT")
@@ -22,6 +75,15 @@ class OCIStorageClient:
         self.config = oci.config.from_file(config_file, config_profile)
         self.object_storage = oci.object_storage.ObjectStorageClient(self.config)
         self.namespace = self.object_storage.get_namespace().data
+        self._upload_manager = oci.object_storage.UploadManager(
+            self.object_storage,
+            allow_multipart_uploads=True,
+            allow_parallel_uploads=True,
+            parallel_process_count=_UPLOAD_PARALLEL_PARTS
+        )
+        
+        # Presigned URLs by (bucket, object, expiration hours), as (expires epoch, url)
+        self._par_cache: Dict[Tuple[str, str, int], Tuple[float, str]] = {}
         
         logger.info(f"OCI Object Storage initialized (namespace: {self.namespace})")
     
@@ -35,18 +97,20 @@ class OCIStorageClient:
         """
         Upload file to OCI Object Storage.
         
+        Files larger than one part are uploaded as parallel multipart uploads.
+        
         Returns:
             Object URL
         """
         try:
-            with open(file_path, 'rb') as file:
-                self.object_storage.put_object(
-                    namespace_name=self.namespace,
-                    bucket_name=bucket_name,
-                    object_name=object_name,
-                    put_object_body=file,
-                    metadata=metadata or {}
-                )
+            self._upload_manager.upload_file(
+                namespace_name=self.namespace,
+                bucket_name=bucket_name,
+                object_name=object_name,
+                file_path=file_path,
+                part_size=_UPLOAD_PART_SIZE,
+                metadata=metadata or {}
+            )
             
             logger.info(f"Uploaded {object_name} to {bucket_name}")
             
@@ -66,17 +130,29 @@ class OCIStorageClient:
         """
         Upload bytes to OCI Object Storage.
         
+        Data larger than one part is uploaded as a parallel multipart upload.
+        
         Returns:
             Object URL
         """
         try:
-            self.object_storage.put_object(
-                namespace_name=self.namespace,
-                bucket_name=bucket_name,
-                object_name=object_name,
-                put_object_body=data,
-                metadata=metadata or {}
-            )
+            if len(data) > _UPLOAD_PART_SIZE:
+                self._upload_manager.upload_stream(
+                    namespace_name=self.namespace,
+                    bucket_name=bucket_name,
+                    object_name=object_name,
+                    stream_ref=io.BytesIO(data),
+                    part_size=_UPLOAD_PART_SIZE,
+                    metadata=metadata or {}
+                )
+            else:
+                self.object_storage.put_object(
+                    namespace_name=self.namespace,
+                    bucket_name=bucket_name,
+                    object_name=object_name,
+                    put_object_body=data,
+                    metadata=metadata or {}
+                )
             
             logger.info(f"Uploaded {object_name} to {bucket_name}")
             
@@ -100,9 +176,10 @@ class OCIStorageClient:
                 object_name=object_name
             )
             
-            with open(file_path, 'wb') as file:
-                for chunk in response.data.raw.stream(1024 * 1024, decode_content=False):
-                    file.write(chunk)
+            _write_chunks(
+                response.data.raw.stream(_DOWNLOAD_CHUNK_SIZE, decode_content=False),
+                file_path
+            )
             
             logger.info(f"Downloaded {object_name} from {bucket_name}")
         
@@ -115,7 +192,13 @@ class OCIStorageClient:
         bucket_name: str,
         object_name: str
     ) -> bytes:
-        """Download file as bytes from OCI Object Storage."""
+        """
+        Download file as bytes from OCI Object Storage.
+        
+        The object is streamed into a buffer preallocated from its
+        Content-Length, so a short or oversized response raises IOError
+        instead of returning a partial or truncated object.
+        """
         try:
             response = self.object_storage.get_object(
                 namespace_name=self.namespace,
@@ -123,7 +206,25 @@ class OCIStorageClient:
                 object_name=object_name
             )
             
-            return response.data.content
+            content_length = response.headers.get('Content-Length')
+            if content_length is None:
+                return response.data.content
+            
+            buffer = bytearray(int(content_length))
+            offset = 0
+            with memoryview(buffer) as view:
+                for chunk in response.data.raw.stream(_DOWNLOAD_CHUNK_SIZE, decode_content=False):
+                    end = offset + len(chunk)
+                    if end > len(buffer):
+                        raise IOError(
+                            f"Oversized download of {object_name}: more than {len(buffer)} bytes"
+                        )
+                    view[offset:end] = chunk
+                    offset = end
+            
+            if offset != len(buffer):
+                raise IOError(f"Incomplete download of {object_name}: {offset} of {len(buffer)} bytes")
+            return bytes(buffer)
         
         except Exception as e:
             logger.error(f"Error downloading bytes: {e}")
@@ -135,26 +236,38 @@ class OCIStorageClient:
         prefix: Optional[str] = None,
         limit: Optional[int] = None
     ) -> List[dict]:
-        """List objects in bucket."""
+        """
+        List objects in bucket.
+        
+        Follows pagination until all objects (or `limit` objects) are listed,
+        requesting full pages so a listing takes as few round-trips as possible.
+        """
         try:
-            response = self.object_storage.list_objects(
-                namespace_name=self.namespace,
-                bucket_name=bucket_name,
-                prefix=prefix,
-                limit=limit
-            )
-            
             objects = []
-            for obj in response.data.objects:
-                objects.append({
-                    'name': obj.name,
-                    'size': obj.size,
-                    'time_created': obj.time_created.isoformat() if obj.time_created else None,
-                    'time_modified': obj.time_modified.isoformat() if obj.time_modified else None,
-                    'md5': obj.md5
-                })
-            
-            return objects
+            start = None
+            while True:
+                page_size = _LIST_PAGE_SIZE if limit is None else min(limit - len(objects), _LIST_PAGE_SIZE)
+                response = self.object_storage.list_objects(
+                    namespace_name=self.namespace,
+                    bucket_name=bucket_name,
+                    prefix=prefix,
+                    start=start,
+                    limit=page_size,
+                    fields=_LIST_FIELDS
+                )
+                
+                for obj in response.data.objects:
+                    objects.append({
+                        'name': obj.name,
+                        'size': obj.size,
+                        'time_created': obj.time_created.isoformat() if obj.time_created else None,
+                        'time_modified': obj.time_modified.isoformat() if obj.time_modified else None,
+                        'md5': obj.md5
+                    })
+                
+                start = response.data.next_start_with
+                if start is None or (limit is not None and len(objects) >= limit):
+                    return objects
         
         except Exception as e:
             logger.error(f"Error listing objects: {e}")
@@ -179,6 +292,36 @@ class OCIStorageClient:
             logger.error(f"Error deleting object: {e}")
             raise
     
+    def delete_objects(
+        self,
+        bucket_name: str,
+        object_names: List[str]
+    ):
+        """
+        Delete many objects from a bucket.
+        
+        Object Storage has no bulk delete, so the requests are issued
+        concurrently on the shared client; every object is attempted and
+        the first failure is raised afterwards.
+        """
+        def delete(object_name):
+            try:
+                self.object_storage.delete_object(
+                    namespace_name=self.namespace,
+                    bucket_name=bucket_name,
+                    object_name=object_name
+                )
+            except Exception as e:
+                return e
+        
+        with ThreadPoolExecutor(max_workers=min(_DELETE_WORKERS, max(len(object_names), 1))) as pool:
+            errors = [e for e in pool.map(delete, object_names) if e is not None]
+        
+        logger.info(f"Deleted {len(object_names) - len(errors)} of {len(object_names)} objects from {bucket_name}")
+        if errors:
+            logger.error(f"Error deleting objects: {errors[0]}")
+            raise errors[0]
+    
     def get_presigned_url(
         self,
         bucket_name: str,
@@ -188,12 +331,21 @@ class OCIStorageClient:
         """
         Generate presigned URL for temporary access.
         
+        URLs are reused for repeat requests until they are close to expiry,
+        instead of creating a new Pre-Authenticated Request each time.
+        
         Returns:
             Presigned URL
         """
+        cache_key = (bucket_name, object_name, expiration_hours)
+        lifetime_s = expiration_hours * 3600
+        cached = self._par_cache.get(cache_key)
+        if cached is not None and time.time() < cached[0] - min(_PAR_REFRESH_MARGIN_S, lifetime_s / 2):
+            return cached[1]
+        
         try:
             # Create PAR (Pre-Authenticated Request)
-            par_details = oci.object_storage.models.CreatePreauthenticatedRequestDetails(
+            par_details = _get_oci().object_storage.models.CreatePreauthenticatedRequestDetails(
                 name=f"temp-access-{datetime.now().timestamp()}",
                 object_name=object_name,
                 access_type="ObjectRead",
@@ -209,6 +361,7 @@ class OCIStorageClient:
             # Construct full URL
             region = self.config['region']
             url = f"https://objectstorage.{region}.oraclecloud.com{par.data.access_uri}"
+            self._par_cache[cache_key] = (time.time() + lifetime_s, url)
             
             logger.info(f"Generated presigned URL for {object_name}")
             
@@ -247,14 +400,17 @@ class OCIStorageClient:
 class DataStorageManager:
     """High-level manager for AquaPredict data storage."""
     
-    def __init__(self):
-        self.storage = OCIStorageClient()
-        self.buckets = {
-            'raw': 'aquapredict-data-raw',
-            'processed': 'aquapredict-data-processed',
-            'models': 'aquapredict-models',
-            'reports': 'aquapredict-reports'
-        }
+    buckets = {
+        'raw': 'aquapredict-data-raw',
+        'processed': 'aquapredict-data-processed',
+        'models': 'aquapredict-models',
+        'reports': 'aquapredict-reports'
+    }
+    
+    @functools.cached_property
+    def storage(self) -> OCIStorageClient:
+        """Object Storage client, connected on first use."""
+        return OCIStorageClient()
     
     def save_raw_data(
         self,
@@ -0,0 +1,7 @@
+"""Pytest configuration for common module tests."""
+
+import sys
+from pathlib import Path
+
+# Common modules are imported by bare name
+sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -0,0 +1,50 @@
+"""Tests for OCI Object Storage downloads."""
+
+import pytest
+from unittest.mock import MagicMock
+
+from oci_storage import OCIStorageClient
+
+
+def _client(chunks, content_length):
+    """Create storage client whose get_object streams the given chunks."""
+    response = MagicMock()
+    response.headers = {} if content_length is None else {'Content-Length': str(content_length)}
+    response.data.content = b''.join(chunks)
+    response.data.raw.stream.return_value = iter(chunks)
+    
+    client = OCIStorageClient.__new__(OCIStorageClient)
+    client.namespace = 'test-namespace'
+    client.object_storage = MagicMock()
+    client.object_storage.get_object.return_value = response
+    return client
+
+
+def test_download_bytes_matches_content():
+    """Test streamed download returns the same bytes as the full content."""
+    chunks = [b'abc', b'defgh', b'ij']
+    
+    data = _client(chunks, 10).download_bytes('bucket', 'object')
+    
+    assert data == b'abcdefghij'
+    assert type(data) is bytes
+
+
+def test_download_bytes_without_content_length():
+    """Test download without Content-Length returns the full content."""
+    data = _client([b'abc', b'def'], None).download_bytes('bucket', 'object')
+    
+    assert data == b'abcdef'
+    assert type(data) is bytes
+
+
+def test_download_bytes_short_read():
+    """Test download shorter than Content-Length raises IOError."""
+    with pytest.raises(IOError, match="Incomplete"):
+        _client([b'abc', b'de'], 10).download_bytes('bucket', 'object')
+
+
+def test_download_bytes_oversized_read():
+    """Test download longer than Content-Length raises IOError."""
+    with pytest.raises(IOError, match="Oversized"):
+        _client([b'abcdef', b'ghijkl'], 10).download_bytes('bucket', 'object')
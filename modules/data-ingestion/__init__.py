@@ -7,7 +7,7 @@ and other sources for aquifer prediction and groundwater analysis.
 
 from .gee_fetcher import GEEDataFetcher
 from .data_exporter import DataExporter
-from .config import IngestionConfig
+from .config import IngestionConfig, get_ingestion_config
 
 __version__ = "1.0.0"
-__all__ = ["GEEDataFetcher", "DataExporter", "IngestionConfig"]
+__all__ = ["GEEDataFetcher", "DataExporter", "IngestionConfig", "get_ingestion_config"]
@@ -1,14 +1,18 @@
 """Configuration for data ingestion module."""
 
+import functools
 import os
 from dataclasses import dataclass
-from typing import Tuple
+from typing import Set, Tuple
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Directories already created by this process
+_dirs_made: Set[str] = set()
 
-@dataclass
+
+@dataclass(frozen=True)
 class IngestionConfig:
     """Configuration for data ingestion."""
     
@@ -28,6 +32,9 @@ class IngestionConfig:
     grid_resolution_km: float = float(os.getenv("GRID_RESOLUTION_KM", "1"))
     grid_resolution_m: float = grid_resolution_km * 1000
     
+    # HTTP download chunk size (bytes)
+    http_chunk_size: int = int(os.getenv("HTTP_CHUNK_SIZE", str(256 * 1024)))
+    
     # Data paths
     data_dir: str = os.getenv("DATA_DIR", "./data")
     raw_data_dir: str = os.path.join(data_dir, "raw")
@@ -49,5 +56,13 @@ class IngestionConfig:
     
     def __post_init__(self):
         """Create directories if they don't exist."""
-        os.makedirs(self.raw_data_dir, exist_ok=True)
-        os.makedirs(self.cache_dir, exist_ok=True)
+        for path in (self.raw_data_dir, self.cache_dir):
+            if path not in _dirs_made:
+                os.makedirs(path, exist_ok=True)
+                _dirs_made.add(path)
+
+
+@functools.lru_cache(maxsize=1)
+def get_ingestion_config() -> IngestionConfig:
+    """Shared default ingestion configuration."""
+    return IngestionConfig()
@@ -1,17 +1,18 @@
 """Data exporter for converting GEE data to local formats."""
 
 import ee
+import io
 import os
 import logging
 import numpy as np
-import rasterio
+from rasterio.io import MemoryFile
 from rasterio.transform import from_bounds
 import xarray as xr
 from typing import Optional, Tuple, Dict, Any
 import requests
 from tqdm import tqdm
 
-from .config import IngestionConfig
+from .config import IngestionConfig, get_ingestion_config
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -27,7 +28,7 @@ class DataExporter:
         Args:
             config: Configuration object
         """
-        self.config = config or IngestionConfig()
+        self.config = config or get_ingestion_config()
     
     def export_to_geotiff(
         self,
@@ -48,22 +49,10 @@ class DataExporter:
         Returns:
             str: Path to exported file
         """
-        scale = scale or self.config.grid_resolution_m
-        region = region or ee.Geometry.Rectangle(self.config.region_bounds)
-        
         logger.info(f"Exporting to GeoTIFF: {output_path}")
         
-        # Get download URL
-        url = image.getDownloadURL({
-            'scale': scale,
-            'crs': self.config.crs,
-            'region': region,
-            'format': 'GEO_TIFF'
-        })
-        
         # Download file
-        response = requests.get(url, stream=True)
-        response.raise_for_status()
+        response = self._request_geotiff(image, scale, region)
         
         # Save to file
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
@@ -75,13 +64,58 @@ class DataExporter:
             unit_scale=True,
             desc=os.path.basename(output_path)
         ) as pbar:
-            for chunk in response.iter_content(chunk_size=8192):
+            for chunk in response.iter_content(chunk_size=self.config.http_chunk_size):
                 f.write(chunk)
                 pbar.update(len(chunk))
         
         logger.info(f"Exported to: {output_path}")
         return output_path
     
+    def _request_geotiff(
+        self,
+        image: ee.Image,
+        scale: Optional[float] = None,
+        region: Optional[ee.Geometry] = None
+    ) -> requests.Response:
+        """Start a streamed GeoTIFF download of a GEE image."""
+        scale = scale or self.config.grid_resolution_m
+        region = region or ee.Geometry.Rectangle(self.config.region_bounds)
+        
+        # Get download URL
+        url = image.getDownloadURL({
+            'scale': scale,
+            'crs': self.config.crs,
+            'region': region,
+            'format': 'GEO_TIFF'
+        })
+        
+        response = requests.get(url, stream=True)
+        response.raise_for_status()
+        return response
+    
+    def download_geotiff_bytes(
+        self,
+        image: ee.Image,
+        scale: Optional[float] = None,
+        region: Optional[ee.Geometry] = None
+    ) -> bytes:
+        """
+        Download GEE image as GeoTIFF bytes, without writing a file.
+        
+        Args:
+            image: GEE image to download
+            scale: Export scale in meters
+            region: Region to export (defaults to config region)
+            
+        Returns:
+            bytes: GeoTIFF content
+        """
+        response = self._request_geotiff(image, scale, region)
+        buffer = io.BytesIO()
+        for chunk in response.iter_content(chunk_size=self.config.http_chunk_size):
+            buffer.write(chunk)
+        return buffer.getvalue()
+    
     def export_to_netcdf(
         self,
         image: ee.Image,
@@ -108,12 +142,11 @@ class DataExporter:
         
         logger.info(f"Exporting to NetCDF: {output_path}")
         
-        # First export to GeoTIFF
-        temp_tif = output_path.replace('.nc', '_temp.tif')
-        self.export_to_geotiff(image, temp_tif, scale, region)
+        # Download the GeoTIFF and decode it in memory
+        geotiff = self.download_geotiff_bytes(image, scale, region)
         
         # Convert to NetCDF using xarray
-        with rasterio.open(temp_tif) as src:
+        with MemoryFile(geotiff) as memfile, memfile.open() as src:
             data = src.read()
             transform = src.transform
             crs = src.crs
@@ -150,10 +183,6 @@ class DataExporter:
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
             ds.to_netcdf(output_path)
         
-        # Clean up temp file
-        if os.path.exists(temp_tif):
-            os.remove(temp_tif)
-        
         logger.info(f"Exported to: {output_path}")
         return output_path
     
@@ -178,13 +207,11 @@ class DataExporter:
         url = feature_collection.getDownloadURL('csv')
         
         # Download file
-        response = requests.get(url)
+        response = requests.get(url, stream=True)
         response.raise_for_status()
         
         # Save to file
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        with open(output_path, 'wb') as f:
-            f.write(response.content)
+        self._write_response(response, output_path)
         
         logger.info(f"Exported to: {output_path}")
         return output_path
@@ -210,17 +237,22 @@ class DataExporter:
         url = feature_collection.getDownloadURL('geojson')
         
         # Download file
-        response = requests.get(url)
+        response = requests.get(url, stream=True)
         response.raise_for_status()
         
         # Save to file
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        with open(output_path, 'wb') as f:
-            f.write(response.content)
+        self._write_response(response, output_path)
         
         logger.info(f"Exported to: {output_path}")
         return output_path
     
+    def _write_response(self, response: requests.Response, output_path: str):
+        """Stream a download response to a file in configured-size chunks."""
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        with open(output_path, 'wb') as f:
+            for chunk in response.iter_content(chunk_size=self.config.http_chunk_size):
+                f.write(chunk)
+    
     def create_grid(
         self,
         resolution_km: Optional[float] = None
@@ -7,7 +7,7 @@ from typing import Tuple, Optional, Dict, Any
 from datetime import datetime
 import json
 
-from .config import IngestionConfig
+from .config import IngestionConfig, get_ingestion_config
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -23,7 +23,7 @@ class GEEDataFetcher:
         Args:
             config: Configuration object. If None, uses default config.
         """
-        self.config = config or IngestionConfig()
+        self.config = config or get_ingestion_config()
         self._initialize_gee()
         self.region = self._create_region_geometry()
         
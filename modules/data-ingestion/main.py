@@ -2,7 +2,9 @@
 
 import logging
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from typing import Any, Callable
 
 from gee_fetcher import GEEDataFetcher
 from data_exporter import DataExporter
@@ -15,6 +17,41 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def fetch_and_export(
+    exporter: DataExporter,
+    name: str,
+    description: str,
+    fetch_fn: Callable[[], Any],
+    output_dir: str,
+    output_format: str
+) -> str:
+    """
+    Fetch one dataset and export it for the Kenya region.
+    
+    Args:
+        exporter: Data exporter
+        name: Dataset name, used for the output file name
+        description: Dataset description for logging
+        fetch_fn: Builds the dataset's GEE image
+        output_dir: Output directory
+        output_format: 'geotiff' or 'netcdf'
+        
+    Returns:
+        str: Path to exported file
+    """
+    logger.info(f"\n>>> Fetching {description}")
+    image = fetch_fn()
+    
+    output_path = f"{output_dir}/kenya_{name}.tif"
+    if output_format == 'geotiff':
+        exporter.export_to_geotiff(image, output_path)
+    else:
+        output_path = output_path.replace('.tif', '.nc')
+        exporter.export_to_netcdf(image, output_path)
+    
+    return output_path
+
+
 def main():
     """Main execution function for data ingestion."""
     parser = argparse.ArgumentParser(description='AquaPredict Data Ingestion')
@@ -47,65 +84,36 @@ def main():
     logger.info(f"Resolution: {config.grid_resolution_km} km")
     logger.info("=" * 80)
     
+    # Requested datasets: (name, description, fetch function)
+    datasets = [
+        ('precipitation', 'Precipitation Data (CHIRPS)', lambda: fetcher.fetch_precipitation(
+            args.start_date,
+            args.end_date,
+            aggregation='monthly'
+        )),
+        ('temperature', 'Temperature Data (ERA5)', lambda: fetcher.fetch_temperature(
+            args.start_date,
+            args.end_date
+        )),
+        ('elevation', 'Elevation Data (SRTM)', fetcher.fetch_elevation),
+        ('landcover', 'Land Cover Data (ESA WorldCover)', lambda: fetcher.fetch_land_cover(year=2020))
+    ]
+    datasets = [d for d in datasets if args.dataset in [d[0], 'all']]
+    
     try:
-        if args.dataset in ['precipitation', 'all']:
-            logger.info("\n>>> Fetching Precipitation Data (CHIRPS)")
-            precip_image = fetcher.fetch_precipitation(
-                args.start_date,
-                args.end_date,
-                aggregation='monthly'
-            )
-            
-            output_path = f"{args.output_dir}/kenya_precipitation.tif"
-            if args.format == 'geotiff':
-                exporter.export_to_geotiff(precip_image, output_path)
-            else:
-                output_path = output_path.replace('.tif', '.nc')
-                exporter.export_to_netcdf(precip_image, output_path)
-            
-            logger.info(f"✓ Precipitation data saved to: {output_path}")
-        
-        if args.dataset in ['temperature', 'all']:
-            logger.info("\n>>> Fetching Temperature Data (ERA5)")
-            temp_image = fetcher.fetch_temperature(
-                args.start_date,
-                args.end_date
-            )
-            
-            output_path = f"{args.output_dir}/kenya_temperature.tif"
-            if args.format == 'geotiff':
-                exporter.export_to_geotiff(temp_image, output_path)
-            else:
-                output_path = output_path.replace('.tif', '.nc')
-                exporter.export_to_netcdf(temp_image, output_path)
-            
-            logger.info(f"✓ Temperature data saved to: {output_path}")
-        
-        if args.dataset in ['elevation', 'all']:
-            logger.info("\n>>> Fetching Elevation Data (SRTM)")
-            elev_image = fetcher.fetch_elevation()
-            
-            output_path = f"{args.output_dir}/kenya_elevation.tif"
-            if args.format == 'geotiff':
-                exporter.export_to_geotiff(elev_image, output_path)
-            else:
-                output_path = output_path.replace('.tif', '.nc')
-                exporter.export_to_netcdf(elev_image, output_path)
-            
-            logger.info(f"✓ Elevation data saved to: {output_path}")
-        
-        if args.dataset in ['landcover', 'all']:
-            logger.info("\n>>> Fetching Land Cover Data (ESA WorldCover)")
-            lc_image = fetcher.fetch_land_cover(year=2020)
-            
-            output_path = f"{args.output_dir}/kenya_landcover.tif"
-            if args.format == 'geotiff':
-                exporter.export_to_geotiff(lc_image, output_path)
-            else:
-                output_path = output_path.replace('.tif', '.nc')
-                exporter.export_to_netcdf(lc_image, output_path)
-            
-            logger.info(f"✓ Land cover data saved to: {output_path}")
+        # Each dataset waits on Earth Engine and its download, so they are
+        # fetched and exported concurrently
+        with ThreadPoolExecutor(max_workers=len(datasets)) as pool:
+            futures = {
+                pool.submit(
+                    fetch_and_export, exporter, name, description, fetch_fn,
+                    args.output_dir, args.format
+                ): name
+                for name, description, fetch_fn in datasets
+            }
+            for future in as_completed(futures):
+                output_path = future.result()
+                logger.info(f"✓ {futures[future].capitalize()} data saved to: {output_path}")
         
         logger.info("\n" + "=" * 80)
         logger.info("✓ Data ingestion completed successfully!")
@@ -76,3 +76,14 @@ def test_config_defaults():
     assert config.grid_resolution_km == 1.0
     assert config.crs == "EPSG:4326"
     assert len(config.region_bounds) == 4
+
+
+def test_shared_config():
+    """Test the shared configuration is built once and immutable."""
+    from dataclasses import FrozenInstanceError
+    from config import get_ingestion_config
+    
+    config = get_ingestion_config()
+    assert get_ingestion_config() is config
+    with pytest.raises(FrozenInstanceError):
+        config.crs = "EPSG:3857"